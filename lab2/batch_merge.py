@@ -0,0 +1,73 @@
+from bisect import bisect_right
+
+from tim_sort import tim_sort, merge
+
+
+# Batches of at least 1/GALLOP_RATIO of the sorted array are merged element
+# by element; smaller ones gallop over the untouched stretches between them
+GALLOP_RATIO = 8
+
+
+def merge_batch(arr, batch):
+    """
+    Merge an unsorted batch into an already sorted list, returning a new list.
+
+    Only the batch is sorted, in O(b log b). Each batch element is then
+    located in arr with a binary search and the stretch of arr before it is
+    copied as one slice, so the merge costs O(n + b log n) with the copying
+    done at C speed. Existing elements come first on ties.
+
+    Args:
+        arr: Sorted list (not modified)
+        batch: New elements in any order (not modified)
+
+    Returns:
+        merged: New sorted list holding the elements of both
+    """
+    batch = tim_sort(list(batch))
+    if len(batch) * GALLOP_RATIO >= len(arr):
+        return merge(arr, batch)
+
+    merged = []
+    i = 0
+    for x in batch:
+        j = bisect_right(arr, x, i)
+        merged.extend(arr[i:j])
+        merged.append(x)
+        i = j
+    merged.extend(arr[i:])
+    return merged
+
+
+def merge_batch_inplace(arr, batch):
+    """
+    Merge an unsorted batch into the sorted list arr in place.
+
+    arr is grown by len(batch) and filled from the back: the largest batch
+    element is placed first, after shifting the untouched stretch of arr that
+    follows it in one slice move. Every element of arr moves at most once and
+    the big list is never copied as a whole.
+
+    Args:
+        arr: Sorted list, extended in place
+        batch: New elements in any order (not modified)
+
+    Returns:
+        arr
+    """
+    batch = tim_sort(list(batch))
+    end = len(arr)
+    arr.extend(batch)
+    write = len(arr)
+
+    for x in reversed(batch):
+        # Existing equal elements stay in front of the new one
+        j = bisect_right(arr, x, 0, end)
+        count = end - j
+        if count:
+            arr[write - count:write] = arr[j:end]
+            write -= count
+        write -= 1
+        arr[write] = x
+        end = j
+    return arr
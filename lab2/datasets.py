@@ -0,0 +1,93 @@
+import mmap
+import os
+import random
+import struct
+from array import array
+
+
+# File layout: magic, array typecode, padding, element count, then raw items
+_MAGIC = b"SDS1"
+_HEADER = struct.Struct("<4sc3xQ")
+
+
+def dataset_rng(pattern_name, n, seed):
+    """
+    Random generator dedicated to one (pattern, n, seed) dataset.
+
+    Seeding with a string is deterministic across runs and Python versions,
+    so the same triple always yields the same input regardless of which
+    other datasets were generated before it.
+    """
+    return random.Random(f"{pattern_name}|{n}|{seed}")
+
+
+def dataset_path(cache_dir, pattern_name, n, seed):
+    """Cache file path for a (pattern, n, seed) dataset"""
+    safe_pattern_name = pattern_name.replace(' ', '_').replace('-', '_')
+    return os.path.join(cache_dir, f"{safe_pattern_name}_n{n}_s{seed}.bin")
+
+
+def save_dataset(path, values):
+    """
+    Write a list of ints or floats as a packed binary file.
+
+    The write goes to a temporary file first so that an interrupted run
+    never leaves a truncated dataset behind.
+    """
+    typecode = 'd' if any(isinstance(v, float) for v in values) else 'q'
+    data = array(typecode, values)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, typecode.encode(), len(data)))
+        data.tofile(f)
+    os.replace(tmp_path, path)
+
+
+def load_dataset(path):
+    """
+    Memory-map a dataset file and return its items as a list.
+
+    Returns:
+        values: List of ints or floats, or None if the file is missing or invalid
+    """
+    if not os.path.exists(path):
+        return None
+
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < _HEADER.size:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            magic, typecode, count = _HEADER.unpack_from(mm, 0)
+            typecode = typecode.decode()
+            if magic != _MAGIC or size != _HEADER.size + count * array(typecode).itemsize:
+                return None
+            view = memoryview(mm)[_HEADER.size:].cast(typecode)
+            try:
+                return view.tolist()
+            finally:
+                view.release()
+
+
+def get_dataset(pattern_name, generator, n, seed, cache_dir="dataset_cache"):
+    """
+    Deterministic input for a (pattern, n, seed) triple, cached on disk.
+
+    Args:
+        pattern_name: Name of the input pattern (part of the cache key)
+        generator: Pattern generator called as generator(n, rng)
+        n: Array size
+        seed: Base seed of the benchmark run
+        cache_dir: Directory holding the cached binary datasets
+
+    Returns:
+        arr: The generated (or cached) input list
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    path = dataset_path(cache_dir, pattern_name, n, seed)
+
+    arr = load_dataset(path)
+    if arr is None:
+        arr = generator(n, dataset_rng(pattern_name, n, seed))
+        save_dataset(path, arr)
+    return arr
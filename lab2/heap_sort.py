@@ -24,6 +24,23 @@ def heapify(arr, n, i):
         heapify(arr, n, largest)
 
 
+# Mirror of heapify for a min-heap (used by nlargest)
+def min_heapify(arr, n, i):
+    smallest = i
+    l = 2 * i + 1
+    r = 2 * i + 2
+
+    if l < n and arr[l] < arr[smallest]:
+        smallest = l
+
+    if r < n and arr[r] < arr[smallest]:
+        smallest = r
+
+    if smallest != i:
+        arr[i], arr[smallest] = arr[smallest], arr[i]
+        min_heapify(arr, n, smallest)
+
+
 # Main function to do heap sort
 def heap_sort(arr):
     n = len(arr)
@@ -38,4 +55,7 @@ def heap_sort(arr):
         arr[0], arr[i] = arr[i], arr[0]
 
         # Call max heapify on the reduced heap
-        heapify(arr, i, 0)
\ No newline at end of file
+        heapify(arr, i, 0)
+
+# Sifting moves equal elements past each other
+heap_sort.stable = False
\ No newline at end of file
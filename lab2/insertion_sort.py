@@ -1,3 +1,6 @@
+from bisect import bisect_right
+
+
 def insertion_sort(arr, left=0, right=None):
     if right is None:
         right = len(arr) - 1
@@ -9,4 +12,39 @@ def insertion_sort(arr, left=0, right=None):
             arr[j + 1] = arr[j]
             j -= 1
         arr[j + 1] = key
-    return arr
\ No newline at end of file
+    return arr
+
+# Elements only move past strictly greater ones
+insertion_sort.stable = True
+
+def binary_insertion_sort(arr, left=0, right=None):
+    # Tuned sorter for small ranges: C-level binary search (bisect) and
+    # slice moves instead of a Python shifting loop
+    if right is None:
+        right = len(arr) - 1
+    if right <= left:
+        return arr
+
+    # Sortedness fast path: extend the run at the start of the range, and
+    # reverse it if it is strictly descending (strict keeps the sort stable)
+    run_end = left + 1
+    if arr[run_end] < arr[left]:
+        while run_end < right and arr[run_end + 1] < arr[run_end]:
+            run_end += 1
+        arr[left:run_end + 1] = arr[run_end:left - 1 if left > 0 else None:-1]
+    else:
+        while run_end < right and not arr[run_end + 1] < arr[run_end]:
+            run_end += 1
+
+    for i in range(run_end + 1, right + 1):
+        key = arr[i]
+        # Already in place: nothing to search or move
+        if not key < arr[i - 1]:
+            continue
+        # Insert after any equal elements so the sort stays stable
+        pos = bisect_right(arr, key, left, i)
+        arr[pos + 1:i + 1] = arr[pos:i]
+        arr[pos] = key
+    return arr
+
+binary_insertion_sort.stable = True
@@ -0,0 +1,120 @@
+import tracemalloc
+
+
+class Counters:
+    """Operation counts collected during one instrumented sort"""
+
+    def __init__(self):
+        self.comparisons = 0
+        self.input_writes = 0
+
+    def reset(self):
+        self.comparisons = 0
+        self.input_writes = 0
+
+
+class CountedItem:
+    """
+    Proxy around an element that counts every comparison made on it.
+
+    The sorting functions are left untouched: they only ever compare and
+    move elements, so wrapping the elements (and the list holding them) is
+    enough to observe them, and uninstrumented runs pay nothing.
+    """
+
+    __slots__ = ("value",)
+
+    # Shared by all proxies of the run in progress
+    counters = Counters()
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        CountedItem.counters.comparisons += 1
+        return self.value < other.value
+
+    def __le__(self, other):
+        CountedItem.counters.comparisons += 1
+        return self.value <= other.value
+
+    def __gt__(self, other):
+        CountedItem.counters.comparisons += 1
+        return self.value > other.value
+
+    def __ge__(self, other):
+        CountedItem.counters.comparisons += 1
+        return self.value >= other.value
+
+    def __eq__(self, other):
+        CountedItem.counters.comparisons += 1
+        return self.value == other.value
+
+    def __ne__(self, other):
+        CountedItem.counters.comparisons += 1
+        return self.value != other.value
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"CountedItem({self.value!r})"
+
+
+class CountingList(list):
+    """
+    List that counts element writes into it (a swap counts as two writes).
+
+    Only the list handed to the sort is a CountingList: moves into the
+    sort's own buffers (merge_sort's L and R, tim_sort's merged runs) go to
+    plain lists and are not seen, and show up in aux_peak_bytes instead.
+    """
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            CountedItem.counters.input_writes += len(value)
+        else:
+            CountedItem.counters.input_writes += 1
+        super().__setitem__(index, value)
+
+
+def count_operations(sort_func, arr):
+    """
+    Run sort_func once on an instrumented copy of arr.
+
+    Args:
+        sort_func: Sorting function taking the list to sort in place
+        arr: Input list (not modified)
+
+    Returns:
+        counts: Dictionary with comparisons, input_writes (element stores
+                into the list being sorted, a swap being two; copies into
+                auxiliary buffers are not included, so the figure is not
+                comparable between in-place and buffer-based sorts) and
+                aux_peak_bytes (peak auxiliary memory the sort allocated,
+                measured with tracemalloc)
+    """
+    counters = Counters()
+    previous = CountedItem.counters
+    CountedItem.counters = counters
+
+    wrapped = CountingList(CountedItem(v) for v in arr)
+
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        sort_func(wrapped)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+        CountedItem.counters = previous
+
+    return {
+        "comparisons": counters.comparisons,
+        "input_writes": counters.input_writes,
+        "aux_peak_bytes": max(0, peak - baseline),
+    }
@@ -1,13 +1,19 @@
+import argparse
 import math
 import sys
 import time
 import random
 from prettytable import PrettyTable
 from heap_sort import heap_sort
-from insertion_sort import insertion_sort
+from insertion_sort import insertion_sort, binary_insertion_sort
 from merge_sort import merge_sort
 from quick_sort import quick_sort
 from tim_sort import tim_sort
+from datasets import get_dataset
+from stability import stable_heap_sort, stable_quick_sort
+from selection import nsmallest, nlargest, select, partial_sort
+from regression import save_baseline, load_baseline, compare_to_baseline, print_regression_report
+from sweep import run_sweep, cell_key, STATUS_OK, STATUS_TIMEOUT, STATUS_ERROR, STATUS_INVALID
 import matplotlib.pyplot as plt
 import os
 
@@ -18,39 +24,46 @@ def merge_sort_wrapper(arr):
 def quick_sort_wrapper(arr):
     quick_sort(arr, 0, len(arr) - 1)
 
+# Wrappers keep the stability declared by the wrapped engines
+merge_sort_wrapper.stable = merge_sort.stable
+quick_sort_wrapper.stable = quick_sort.stable
+
 # List of sorting algorithms with names and functions
 sort_algorithms = [
     ("Heap Sort", heap_sort),
     ("Insertion Sort", insertion_sort),
+    ("Binary Insertion Sort", binary_insertion_sort),
     ("Merge Sort", merge_sort_wrapper),
     ("Quick Sort", quick_sort_wrapper),
-    ("Tim Sort", tim_sort)
+    ("Tim Sort", tim_sort),
+    ("Stable Heap Sort", stable_heap_sort),
+    ("Stable Quick Sort", stable_quick_sort)
 ]
 
-# Pattern generation functions
-def generate_reversed_sorted(n):
+# Pattern generation functions (rng is a random.Random for seeded datasets)
+def generate_reversed_sorted(n, rng=random):
     return list(range(n, 0, -1))
 
-def generate_almost_sorted(n):
+def generate_almost_sorted(n, rng=random):
     arr = list(range(1, n + 1))
     num_swaps = max(1, n // 20)
     for _ in range(num_swaps):
-        i, j = random.sample(range(n), 2)
+        i, j = rng.sample(range(n), 2)
         arr[i], arr[j] = arr[j], arr[i]
     return arr
 
-def generate_few_unique(n):
+def generate_few_unique(n, rng=random):
     num_unique = max(1, int(n ** 0.5))
-    unique_vals = [random.randint(1, n) for _ in range(num_unique)]
-    return [random.choice(unique_vals) for _ in range(n)]
+    unique_vals = [rng.randint(1, n) for _ in range(num_unique)]
+    return [rng.choice(unique_vals) for _ in range(n)]
 
-def generate_random_int(n):
-    return [random.randint(1, n) for _ in range(n)]
+def generate_random_int(n, rng=random):
+    return [rng.randint(1, n) for _ in range(n)]
 
-def generate_sorted(n):
+def generate_sorted(n, rng=random):
     return list(range(1, n + 1))
 
-def generate_sawtooth(n):
+def generate_sawtooth(n, rng=random):
     arr = []
     for i in range(1, n // 2 + 1):
         arr.append(i)
@@ -59,17 +72,17 @@ def generate_sawtooth(n):
         arr.append(n // 2 + 1)
     return arr
 
-def generate_all_equal_except_one(n):
+def generate_all_equal_except_one(n, rng=random):
     arr = [5] * n
-    outlier_index = random.randint(0, n - 1)
-    arr[outlier_index] = random.choice([-100, 100])
+    outlier_index = rng.randint(0, n - 1)
+    arr[outlier_index] = rng.choice([-100, 100])
     return arr
 
-def generate_random_float(n):
-    return [random.uniform(-100, 100) for _ in range(n)]
+def generate_random_float(n, rng=random):
+    return [rng.uniform(-100, 100) for _ in range(n)]
 
-def generate_close_values(n):
-    return [1.0 + random.uniform(-0.001, 0.001) for _ in range(n)]
+def generate_close_values(n, rng=random):
+    return [1.0 + rng.uniform(-0.001, 0.001) for _ in range(n)]
 
 # Dictionary mapping pattern names to generators
 pattern_generators = {
@@ -85,7 +98,37 @@ pattern_generators = {
 }
 
 # Array sizes to test
-array_sizes = [10, 100, 500, 1000, 1500]#, 2000, 2500, 3000, 3500, 4000, 4500, 5000, 6000, 7000, 8000, 9000, 10000]
+array_sizes = [10, 100, 500, 1000, 1500, 2000, 2500, 3000, 3500, 4000, 4500, 5000, 6000, 7000, 8000, 9000, 10000]
+
+# Sweep settings: cells run in parallel processes, any cell over the time
+# budget is killed and marked as a timeout, finished cells are checkpointed
+# so an interrupted sweep can be continued with --resume
+SWEEP_WORKERS = os.cpu_count()
+CELL_TIMEOUT = 120.0
+
+# Budget for verification and instrumentation, which start once a cell's
+# timings are in; the proxied runs are 30-70x slower than the sort itself,
+# and a cell that overruns this keeps its timings
+CHECK_TIMEOUT = 300.0
+
+# Baselines are saved and checked with one worker, so that timed runs do
+# not compete for the CPU and both sides are measured the same way
+BASELINE_WORKERS = 1
+
+# Inputs are deterministic per (pattern, n, SEED) and cached as binary files,
+# so repeated sweeps skip generation and runs are comparable across commits
+SEED = 2025
+DATASET_DIR = "dataset_cache"
+CHECKPOINT_FILE = f"sweep_checkpoint_seed{SEED}.jsonl"
+
+# Opt-in operation counting (comparisons, writes to the input list, auxiliary memory);
+# done in one extra untimed run per cell, so timings are unaffected
+INSTRUMENT = False
+
+# Verify every cell's output (sortedness, plus stability for stable engines)
+# in one extra untimed run on index-tagged input, after the timings and
+# under CHECK_TIMEOUT
+VERIFY = True
 
 # Function to measure execution time
 def measure_time(sort_func, arr):
@@ -99,52 +142,83 @@ def measure_time(sort_func, arr):
         print(f"Error in sorting: {e}")
         return None
 
+def format_cell(record):
+    """Format a sweep record for the result tables"""
+    if record is None or record["status"] == STATUS_ERROR:
+        return "N/A"
+    if record["status"] == STATUS_TIMEOUT:
+        return "TIMEOUT"
+    if record["status"] == STATUS_INVALID:
+        return "INVALID"
+    return f"{record['avg_time']:.6f}"
+
+def format_counts(record):
+    """Format the operation counts of a sweep record as table cells"""
+    counts = record.get("counts") if record is not None else None
+    if not counts:
+        return ["-", "-", "-"]
+    return [str(counts["comparisons"]), str(counts["input_writes"]), f"{counts['aux_peak_bytes'] / 1024:.1f}"]
+
 # Main benchmarking function with plotting
-def benchmark_sorting():
+def benchmark_sorting(checkpoint_path=CHECKPOINT_FILE, resume=False, workers=SWEEP_WORKERS):
     sys.setrecursionlimit(99999999)
 
+    # Build every (algorithm, pattern, size) cell; each pattern input is
+    # generated once per size and shared by all algorithms
+    cells = []
+    for n in array_sizes:
+        # Determine the number of runs based on array size
+        if n >= 9999:
+            num_runs = 1
+        else:
+            num_runs = 5
+        for pattern_name, generator in pattern_generators.items():
+            arr = get_dataset(pattern_name, generator, n, SEED, DATASET_DIR)
+            for sort_name, sort_func in sort_algorithms:
+                cells.append((sort_name, sort_func, pattern_name, n, arr, num_runs))
+
+    def report(record):
+        print(f"[{record['status']:>7}] {record['algorithm']} / {record['pattern']} / n={record['size']}: "
+              f"{format_cell(record)}")
+        if record["status"] == STATUS_INVALID:
+            print(f"          wrong output: {record['error']}")
+        elif record["status"] == STATUS_OK and record.get("error"):
+            print(f"          unchecked: {record['error']}")
+
+    sweep = run_sweep(cells, timeout=CELL_TIMEOUT, workers=workers,
+                      checkpoint_path=checkpoint_path, on_result=report, instrument=INSTRUMENT,
+                      verify=VERIFY, resume=resume, check_timeout=CHECK_TIMEOUT)
+
     # Initialize results dictionary to store average times
     results = {
         pattern_name: {sort_name: [] for sort_name, _ in sort_algorithms}
         for pattern_name in pattern_generators
     }
 
-    # Benchmarking loop
     for n in array_sizes:
         print(f"\nArray size: {n}")
-        for pattern_name, generator in pattern_generators.items():
+        for pattern_name in pattern_generators:
             print(f"\nPattern: {pattern_name}")
-            arr = generator(n)
 
             # Create a table for this pattern
             table = PrettyTable()
-            table.field_names = ["Sorting Algorithm", "Average Time (s)"]
-
-            # Benchmark each sorting algorithm
-            for sort_name, sort_func in sort_algorithms:
-                # Determine the number of runs based on array size and algorithm
-                if n >= 9999:
-                    num_runs = 1
-                else:
-                    num_runs = 5
-
-                times = []
-                for _ in range(num_runs):
-                    time_taken = measure_time(sort_func, arr)
-                    if time_taken is not None:
-                        times.append(time_taken)
-
-                # Compute average time or use nan if no successful runs
-                if times:
-                    avg_time = sum(times) / len(times)
+            fields = ["Sorting Algorithm", "Average Time (s)"]
+            if INSTRUMENT:
+                fields += ["Comparisons", "Input Writes", "Aux Peak (KiB)"]
+            table.field_names = fields
+
+            for sort_name, _ in sort_algorithms:
+                record = sweep.get(cell_key(sort_name, pattern_name, n))
+                row = [sort_name, format_cell(record)]
+                if INSTRUMENT:
+                    row += format_counts(record)
+                table.add_row(row)
+
+                # Timeouts and errors are stored as nan
+                if record is None or record["status"] != STATUS_OK:
+                    results[pattern_name][sort_name].append(float('nan'))
                 else:
-                    avg_time = float('nan')
-
-                # Add to table (display "N/A" for nan)
-                table.add_row([sort_name, "N/A" if avg_time != avg_time else f"{avg_time:.6f}"])
-
-                # Append average time to results
-                results[pattern_name][sort_name].append(avg_time)
+                    results[pattern_name][sort_name].append(record["avg_time"])
 
             # Print the table
             print(table)
@@ -191,9 +265,10 @@ def benchmark_sorting():
         plt.savefig(f'{safe_sort_name}/Performance_Across_Patterns.png')
         plt.close()
 
-    for sort_name, _ in sort_algorithms:
+    for sort_name, sort_func in sort_algorithms:
         # Print a separator and title for clarity
-        print(f"\n---------- Summary for {sort_name} ----------")
+        stability = "stable" if getattr(sort_func, "stable", False) else "unstable"
+        print(f"\n---------- Summary for {sort_name} ({stability}) ----------")
 
         # Create a new table
         table = PrettyTable()
@@ -201,21 +276,86 @@ def benchmark_sorting():
 
         # Add a row for each pattern
         for pattern_name in pattern_generators:
-            # Get the list of average times for this pattern and sorting algorithm
-            times = results[pattern_name][sort_name]
             row = [pattern_name]
 
-            # Format each time value
-            for time in times:
-                if math.isnan(time):
-                    row.append("N/A")  # Handle cases where time is not available
-                else:
-                    row.append(f"{time:.6f}")  # Format time to 6 decimal places
+            # Format each cell (timeouts and errors are shown explicitly)
+            for n in array_sizes:
+                row.append(format_cell(sweep.get(cell_key(sort_name, pattern_name, n))))
             table.add_row(row)
 
         # Print the table
         print(table)
 
+        # Operation counts next to the times when instrumented
+        if INSTRUMENT:
+            for count_label, count_key in [("Comparisons", "comparisons"), ("Writes to input list", "input_writes")]:
+                print(f"{count_label} for {sort_name}:")
+                table = PrettyTable()
+                table.field_names = ["Pattern"] + [str(size) for size in array_sizes]
+                for pattern_name in pattern_generators:
+                    row = [pattern_name]
+                    for n in array_sizes:
+                        record = sweep.get(cell_key(sort_name, pattern_name, n))
+                        counts = record.get("counts") if record is not None else None
+                        row.append(str(counts[count_key]) if counts else "-")
+                    table.add_row(row)
+                print(table)
+
+    return sweep
+
+# Top-k / selection benchmark: the partial APIs against a full sort
+def benchmark_partial(k=100):
+    partial_algorithms = [
+        ("Full Sort (Tim Sort)", tim_sort),
+        (f"nsmallest({k})", lambda arr: nsmallest(arr, k)),
+        (f"nlargest({k})", lambda arr: nlargest(arr, k)),
+        (f"partial_sort({k})", lambda arr: partial_sort(arr, k)),
+        ("select(median)", lambda arr: select(arr, (len(arr) - 1) // 2)),
+    ]
+
+    for n in array_sizes:
+        print(f"\nArray size: {n}")
+        table = PrettyTable()
+        table.field_names = ["Pattern"] + [name for name, _ in partial_algorithms]
+        for pattern_name, generator in pattern_generators.items():
+            arr = get_dataset(pattern_name, generator, n, SEED, DATASET_DIR)
+            row = [pattern_name]
+            for _, func in partial_algorithms:
+                time_taken = measure_time(func, arr)
+                row.append("N/A" if time_taken is None else f"{time_taken:.6f}")
+            table.add_row(row)
+        print(table)
+
 # Run the benchmark
 if __name__ == "__main__":
-    benchmark_sorting()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Benchmark the lab2 sorting algorithms")
+    parser.add_argument("--save-baseline", metavar="PATH",
+                        help="store the results as a regression baseline")
+    parser.add_argument("--check-baseline", metavar="PATH",
+                        help="compare the results with a stored baseline and exit non-zero on regressions")
+    parser.add_argument("--resume", action="store_true",
+                        help="continue an interrupted sweep from its checkpoint instead of measuring every cell")
+    parser.add_argument("--partial", metavar="K", type=int,
+                        help="benchmark top-k selection and partial sorting instead")
+    args = parser.parse_args()
+
+    if args.partial:
+        benchmark_partial(args.partial)
+        sys.exit(0)
+
+    # Baselines must measure the current code with BASELINE_WORKERS, never
+    # resume cells an ordinary sweep timed with SWEEP_WORKERS
+    baseline_run = args.save_baseline or args.check_baseline
+    if baseline_run and args.resume:
+        parser.error("--resume cannot be combined with --save-baseline or --check-baseline")
+    sweep = benchmark_sorting(checkpoint_path=None if args.check_baseline else CHECKPOINT_FILE,
+                              resume=args.resume,
+                              workers=BASELINE_WORKERS if baseline_run else SWEEP_WORKERS)
+
+    if args.save_baseline:
+        save_baseline(sweep, args.save_baseline)
+        print(f"\nBaseline saved to {args.save_baseline}")
+    if args.check_baseline:
+        regressions, compared = compare_to_baseline(sweep, load_baseline(args.check_baseline))
+        if not print_regression_report(regressions, compared):
+            sys.exit(1)
\ No newline at end of file
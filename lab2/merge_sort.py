@@ -1,3 +1,9 @@
+from insertion_sort import binary_insertion_sort
+
+# Ranges this small are sorted directly by binary insertion
+LEAF_SIZE = 32
+
+
 def merge(arr, left, mid, right):
     n1 = mid - left + 1
     n2 = right - mid
@@ -42,9 +48,14 @@ def merge(arr, left, mid, right):
         k += 1
 
 def merge_sort(arr, left, right):
-    if left < right:
+    if right - left < LEAF_SIZE:
+        binary_insertion_sort(arr, left, right)
+    else:
         mid = (left + right) // 2
 
         merge_sort(arr, left, mid)
         merge_sort(arr, mid + 1, right)
-        merge(arr, left, mid, right)
\ No newline at end of file
+        merge(arr, left, mid, right)
+
+# merge takes from the left half on ties (L[i] <= R[j])
+merge_sort.stable = True
\ No newline at end of file
@@ -1,3 +1,9 @@
+from insertion_sort import binary_insertion_sort
+
+# Ranges this small are sorted directly by binary insertion
+LEAF_SIZE = 32
+
+
 def partition(array, low, high):
     # choose the rightmost element as pivot
     pivot = array[high]
@@ -13,7 +19,12 @@ def partition(array, low, high):
     return i + 1
 
 def quick_sort(array, low, high):
-    if low < high:
+    if high - low < LEAF_SIZE:
+        binary_insertion_sort(array, low, high)
+    else:
         pi = partition(array, low, high)
         quick_sort(array, low, pi - 1)
         quick_sort(array, pi + 1, high)
+
+# Long-range swaps during partitioning reorder equal elements
+quick_sort.stable = False
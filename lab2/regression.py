@@ -0,0 +1,115 @@
+import json
+import statistics
+
+from prettytable import PrettyTable
+from sweep import STATUS_OK
+
+
+# A cell regresses only if it is slower by more than REL_THRESHOLD, by more
+# than NOISE_FACTOR times the measured run-to-run spread, and by more than
+# MIN_ABS_DELTA seconds (tiny arrays are dominated by timer noise)
+REL_THRESHOLD = 0.10
+NOISE_FACTOR = 3.0
+MIN_ABS_DELTA = 50e-6
+
+
+def summarize_times(times):
+    """Median and robust spread (scaled median absolute deviation) of run times"""
+    median = statistics.median(times)
+    mad = statistics.median(abs(t - median) for t in times)
+    # 1.4826 makes the MAD comparable to a standard deviation for normal noise
+    return median, 1.4826 * mad
+
+
+def _cell_stats(record):
+    times = record.get("times") or [record["avg_time"]]
+    median, spread = summarize_times(times)
+    return {"median": median, "spread": spread, "runs": len(times)}
+
+
+def save_baseline(sweep, path):
+    """
+    Store the successful cells of a sweep as a regression baseline.
+
+    Args:
+        sweep: Dictionary of cell_key -> record, as returned by run_sweep
+        path: JSON file to write
+    """
+    baseline = {
+        key: dict(_cell_stats(record), algorithm=record["algorithm"],
+                  pattern=record["pattern"], size=record["size"])
+        for key, record in sweep.items()
+        if record["status"] == STATUS_OK
+    }
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=1, sort_keys=True)
+
+
+def load_baseline(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare_to_baseline(sweep, baseline, rel_threshold=REL_THRESHOLD,
+                        noise_factor=NOISE_FACTOR, min_abs_delta=MIN_ABS_DELTA):
+    """
+    Compare a sweep against a stored baseline cell by cell.
+
+    Args:
+        sweep: Dictionary of cell_key -> record from the current run
+        baseline: Dictionary loaded with load_baseline
+        rel_threshold: Relative slowdown that is tolerated
+        noise_factor: Multiple of the combined run-to-run spread that is tolerated
+        min_abs_delta: Absolute slowdown (seconds) below which nothing is flagged
+
+    Returns:
+        regressions: List of dictionaries describing the offending cells, sorted
+                     by slowdown ratio (cells that used to finish but now time
+                     out, raise or produce wrong output are always reported)
+        compared: Number of cells present in both runs
+    """
+    regressions = []
+    compared = 0
+
+    for key, base in baseline.items():
+        record = sweep.get(key)
+        if record is None:
+            continue
+        compared += 1
+
+        # Timeouts, errors and wrong output all fail the gate
+        if record["status"] != STATUS_OK:
+            regressions.append(dict(algorithm=base["algorithm"], pattern=base["pattern"], size=base["size"],
+                                    baseline=base["median"], current=float('inf'), ratio=float('inf'),
+                                    status=record["status"]))
+            continue
+
+        current = _cell_stats(record)
+        delta = current["median"] - base["median"]
+        ratio = current["median"] / base["median"] if base["median"] > 0 else float('inf')
+        noise = noise_factor * max(base["spread"], current["spread"])
+
+        if ratio > 1 + rel_threshold and delta > noise and delta > min_abs_delta:
+            regressions.append(dict(algorithm=base["algorithm"], pattern=base["pattern"], size=base["size"],
+                                    baseline=base["median"], current=current["median"], ratio=ratio,
+                                    status=STATUS_OK))
+
+    regressions.sort(key=lambda r: r["ratio"], reverse=True)
+    return regressions, compared
+
+
+def print_regression_report(regressions, compared):
+    """Print a pass/fail report and return True if no cell regressed"""
+    if not regressions:
+        print(f"\nRegression check PASSED ({compared} cells compared)")
+        return True
+
+    print(f"\nRegression check FAILED: {len(regressions)} of {compared} cells regressed against the baseline")
+    table = PrettyTable()
+    table.field_names = ["Sorting Algorithm", "Pattern", "Size", "Baseline (s)", "Current (s)", "Ratio"]
+    for r in regressions:
+        current = r["status"].upper() if r["status"] != STATUS_OK else f"{r['current']:.6f}"
+        ratio = "-" if r["ratio"] == float('inf') else f"{r['ratio']:.2f}x"
+        table.add_row([r["algorithm"], r["pattern"], r["size"], f"{r['baseline']:.6f}", current, ratio])
+    print(table)
+    return False
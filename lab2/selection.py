@@ -0,0 +1,178 @@
+import math
+
+from heap_sort import heapify, min_heapify, heap_sort
+from insertion_sort import binary_insertion_sort
+from merge_sort import merge_sort
+from quick_sort import partition, LEAF_SIZE
+
+
+def nsmallest(arr, k):
+    """
+    The k smallest elements of arr in ascending order, in O(n log k).
+
+    A max-heap of the k best candidates is kept with heapify; every later
+    element smaller than the heap root replaces it. arr is not modified.
+    """
+    k = min(k, len(arr))
+    if k <= 0:
+        return []
+
+    heap = arr[:k]
+    for i in range(k // 2 - 1, -1, -1):
+        heapify(heap, k, i)
+
+    for idx in range(k, len(arr)):
+        x = arr[idx]
+        if x < heap[0]:
+            heap[0] = x
+            heapify(heap, k, 0)
+
+    heap_sort(heap)
+    return heap
+
+
+def nlargest(arr, k):
+    """The k largest elements of arr in descending order, in O(n log k)"""
+    k = min(k, len(arr))
+    if k <= 0:
+        return []
+
+    heap = arr[:k]
+    for i in range(k // 2 - 1, -1, -1):
+        min_heapify(heap, k, i)
+
+    for idx in range(k, len(arr)):
+        x = arr[idx]
+        if heap[0] < x:
+            heap[0] = x
+            min_heapify(heap, k, 0)
+
+    heap_sort(heap)
+    heap.reverse()
+    return heap
+
+
+def _partition3(arr, low, high, pivot_index):
+    """
+    Three-way partition of arr[low..high] around arr[pivot_index].
+
+    Returns:
+        lt, gt: arr[low..lt-1] < pivot, arr[lt..gt] == pivot, arr[gt+1..high] > pivot
+    """
+    pivot = arr[pivot_index]
+    lt, i, gt = low, low, high
+    while i <= gt:
+        if arr[i] < pivot:
+            arr[lt], arr[i] = arr[i], arr[lt]
+            lt += 1
+            i += 1
+        elif pivot < arr[i]:
+            arr[i], arr[gt] = arr[gt], arr[i]
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+
+def _median_of_medians(arr, low, high):
+    """Index of a pivot guaranteed to lie between the 30th and 70th percentile"""
+    if high - low < 5:
+        binary_insertion_sort(arr, low, high)
+        return low + (high - low) // 2
+
+    # Sort groups of five and gather their medians at the front of the range
+    store = low
+    for i in range(low, high + 1, 5):
+        group_high = min(i + 4, high)
+        binary_insertion_sort(arr, i, group_high)
+        m = i + (group_high - i) // 2
+        arr[m], arr[store] = arr[store], arr[m]
+        store += 1
+
+    mid = low + (store - 1 - low) // 2
+    _select(arr, low, store - 1, mid, depth_limit=0)
+    return mid
+
+
+def _select(arr, low, high, k, depth_limit):
+    unbalanced = 0
+    while True:
+        if high - low < LEAF_SIZE:
+            binary_insertion_sort(arr, low, high)
+            return
+
+        if depth_limit > 0:
+            # Quickselect step: median-of-three pivot moved to the end for partition
+            depth_limit -= 1
+            mid = low + (high - low) // 2
+            if arr[mid] < arr[low]:
+                arr[mid], arr[low] = arr[low], arr[mid]
+            if arr[high] < arr[low]:
+                arr[high], arr[low] = arr[low], arr[high]
+            if arr[mid] < arr[high]:
+                arr[mid], arr[high] = arr[high], arr[mid]
+            size = high - low + 1
+            p = partition(arr, low, high)
+            if k == p:
+                return
+            if k < p:
+                high = p - 1
+            else:
+                low = p + 1
+            # Two badly unbalanced splits in a row (typically many equal keys,
+            # which partition puts all on one side) end the quickselect phase
+            if 4 * (high - low + 1) > 3 * size:
+                unbalanced += 1
+                if unbalanced == 2:
+                    depth_limit = 0
+            else:
+                unbalanced = 0
+        else:
+            # Fallback with a linear worst case: median-of-medians pivot and a
+            # three-way partition so runs of equal keys cannot stall progress
+            lt, gt = _partition3(arr, low, high, _median_of_medians(arr, low, high))
+            if k < lt:
+                high = lt - 1
+            elif k > gt:
+                low = gt + 1
+            else:
+                return
+
+
+def select(arr, k):
+    """
+    Introselect: rearrange arr in place so arr[k] is the k-th smallest element
+    (0-based), everything before it is <= and everything after it is >=.
+
+    Quickselect on quick_sort.partition runs in expected O(n); once it has
+    spent 2*log2(n) partitioning rounds, or hit two badly unbalanced splits
+    in a row, it switches to median-of-medians, which bounds the worst case
+    to O(n) as well.
+
+    Returns:
+        The k-th smallest element
+    """
+    n = len(arr)
+    if not 0 <= k < n:
+        raise IndexError("select index out of range")
+    _select(arr, 0, n - 1, k, depth_limit=2 * max(1, int(math.log2(n))))
+    return arr[k]
+
+
+def partial_sort(arr, k):
+    """
+    Rearrange arr in place so that arr[:k] holds its k smallest elements in
+    ascending order, in O(n + k log k). The rest is left in unspecified order.
+    """
+    k = min(k, len(arr))
+    if k <= 0:
+        return arr
+    select(arr, k - 1)
+    merge_sort(arr, 0, k - 1)
+    return arr
+
+
+def median(arr):
+    """Lower median of arr in O(n), without modifying arr"""
+    work = list(arr)
+    return select(work, (len(work) - 1) // 2)
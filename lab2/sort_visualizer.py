@@ -1,6 +1,35 @@
+import argparse
+import os
+import struct
 import pygame
 import sys
 import random
+from array import array
+from collections import OrderedDict
+
+# ----- Command Line -----
+parser = argparse.ArgumentParser(description="Sorting algorithm visualizer")
+parser.add_argument("--headless", action="store_true",
+                    help="run without a display and record the animation to disk")
+parser.add_argument("--algorithm", default="Quick Sort",
+                    help="algorithm to record in headless mode (or \"All\")")
+parser.add_argument("--preset", default="Random", help="array preset for headless mode")
+parser.add_argument("--size", type=int, default=200, help="array size for headless mode")
+parser.add_argument("--min-value", type=float, default=-10.0)
+parser.add_argument("--max-value", type=float, default=100.0)
+parser.add_argument("--seed", type=int, default=None, help="seed for the generated array")
+parser.add_argument("--out", default="recording", help="output directory for headless mode")
+parser.add_argument("--frames", action="store_true",
+                    help="write PNG frames in addition to the per-step delta log")
+parser.add_argument("--frame-every", type=int, default=1, help="write a frame every N steps")
+parser.add_argument("--width", type=int, default=1280, help="frame width in headless mode")
+parser.add_argument("--height", type=int, default=720, help="frame height in headless mode")
+parser.add_argument("--show-values", action="store_true", help="draw value labels on frames")
+args = parser.parse_args()
+
+# No window is ever opened in headless mode
+if args.headless:
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
 
 pygame.init()
 pygame.font.init()
@@ -179,28 +208,78 @@ class Checkbox:
             if self.rect.collidepoint(event.pos):
                 self.checked = not self.checked
 
+# ----- Finalized State -----
+class FinalizedSet:
+    """
+    Finalized bar indices shared by reference between a generator and the
+    renderer. Membership is a bytearray lookup, `added` lists the indices in
+    the order they were finalized, so a consumer that remembers the previous
+    length can pick up just the new ones.
+    """
+
+    __slots__ = ("flags", "added")
+
+    def __init__(self, n):
+        self.flags = bytearray(n)
+        self.added = []
+
+    def add(self, i):
+        if not self.flags[i]:
+            self.flags[i] = 1
+            self.added.append(i)
+
+    def fill(self):
+        for i in range(len(self.flags)):
+            if not self.flags[i]:
+                self.flags[i] = 1
+                self.added.append(i)
+
+    def truncate(self, count):
+        """Un-finalize everything added after the first count indices"""
+        for i in self.added[count:]:
+            self.flags[i] = 0
+        del self.added[count:]
+
+    def __contains__(self, i):
+        return self.flags[i] == 1
+
+    def __len__(self):
+        return len(self.added)
+
 # ----- Sorting Algorithm Generators -----
 def insertion_sort_visual(arr, left=0, right=None):
     if right is None:
         right = len(arr) - 1
+    # The sorted prefix is only shown as finalized when sorting the whole array
+    whole = left == 0 and right == len(arr) - 1
+    finalized = FinalizedSet(len(arr))
     for i in range(left + 1, right + 1):
+        if whole:
+            finalized.add(i - 1)
         key = arr[i]
         j = i - 1
         while j >= left and arr[j] > key:
             arr[j + 1] = arr[j]
-            finalized = list(range(i)) if left == 0 and right == len(arr) - 1 else []
-            yield arr, (j, j + 1), finalized.copy()
+            yield arr, (j, j + 1), finalized
             j -= 1
         arr[j + 1] = key
-        finalized = list(range(i + 1)) if left == 0 and right == len(arr) - 1 else []
-        yield arr, (j + 1, i), finalized.copy()
-    if left == 0 and right == len(arr) - 1:
-        yield arr, None, list(range(len(arr)))
+        if whole:
+            finalized.add(i)
+        yield arr, (j + 1, i), finalized
+    if whole:
+        finalized.fill()
+        yield arr, None, finalized
 
 def binary_insertion_sort_visual(arr, left=0, right=None):
     if right is None:
         right = len(arr) - 1
+    whole = left == 0 and right == len(arr) - 1
+    finalized = FinalizedSet(len(arr))
+    if whole and right >= left:
+        finalized.add(left)
     for i in range(left + 1, right + 1):
+        if whole:
+            finalized.add(i)
         key = arr[i]
         # Binary search to find the insertion position
         low = left
@@ -215,18 +294,17 @@ def binary_insertion_sort_visual(arr, left=0, right=None):
         # Shift elements from pos to i-1 to the right
         for j in range(i - 1, pos - 1, -1):
             arr[j + 1] = arr[j]
-            finalized = list(range(left, i + 1)) if left == 0 and right == len(arr) - 1 else []
-            yield arr, (j, j + 1), finalized.copy()
+            yield arr, (j, j + 1), finalized
         # Insert the key at pos
         arr[pos] = key
-        finalized = list(range(left, i + 1)) if left == 0 and right == len(arr) - 1 else []
-        yield arr, (pos, i), finalized.copy()
+        yield arr, (pos, i), finalized
     # If sorting the entire array, yield with all finalized
-    if left == 0 and right == len(arr) - 1:
-        yield arr, None, list(range(len(arr)))
+    if whole:
+        finalized.fill()
+        yield arr, None, finalized
 
 def quick_sort_visual(arr):
-    finalized = []
+    finalized = FinalizedSet(len(arr))
     stack = [(0, len(arr) - 1)]
     while stack:
         low, high = stack.pop()
@@ -237,20 +315,18 @@ def quick_sort_visual(arr):
                 if arr[j] <= pivot:
                     i += 1
                     arr[i], arr[j] = arr[j], arr[i]
-                    yield arr, (i, j), finalized.copy()
+                    yield arr, (i, j), finalized
             arr[i + 1], arr[high] = arr[high], arr[i + 1]
             p = i + 1
-            finalized.append(p)
-            yield arr, (i + 1, high), finalized.copy()
+            finalized.add(p)
+            yield arr, (i + 1, high), finalized
             stack.append((low, p - 1))
             stack.append((p + 1, high))
         elif low == high and low not in finalized:
-            finalized.append(low)
-            yield arr, None, finalized.copy()
-    all_indices = set(range(len(arr)))
-    missing = all_indices - set(finalized)
-    if missing:
-        finalized.extend(missing)
+            finalized.add(low)
+            yield arr, None, finalized
+    if len(finalized) < len(arr):
+        finalized.fill()
         yield arr, None, finalized
 
 def heapify_visual(arr, n, i, finalized):
@@ -263,30 +339,29 @@ def heapify_visual(arr, n, i, finalized):
         largest = r
     if largest != i:
         arr[i], arr[largest] = arr[largest], arr[i]
-        yield arr, (i, largest), finalized.copy()
+        yield arr, (i, largest), finalized
         yield from heapify_visual(arr, n, largest, finalized)
 
 def heap_sort_visual(arr):
     n = len(arr)
-    finalized = []
+    finalized = FinalizedSet(n)
     for i in range(n // 2 - 1, -1, -1):
         yield from heapify_visual(arr, n, i, finalized)
     for i in range(n - 1, 0, -1):
         arr[0], arr[i] = arr[i], arr[0]
-        finalized.append(i)
-        yield arr, (0, i), finalized.copy()
+        finalized.add(i)
+        yield arr, (0, i), finalized
         yield from heapify_visual(arr, i, 0, finalized)
-    if 0 not in finalized:
-        finalized.append(0)
+    if n > 0 and 0 not in finalized:
+        finalized.add(0)
         yield arr, None, finalized
-    all_indices = set(range(len(arr)))
     if len(finalized) < len(arr):
-        finalized = list(all_indices)
+        finalized.fill()
         yield arr, None, finalized
 
 def merge_sort_visual(arr):
     n = len(arr)
-    finalized = []
+    finalized = FinalizedSet(n)
     curr_size = 1
     while curr_size < n:
         for left in range(0, n, 2 * curr_size):
@@ -302,27 +377,24 @@ def merge_sort_visual(arr):
                 else:
                     merged.append(arr[j])
                     j += 1
-                yield arr, None, finalized.copy()
+                yield arr, None, finalized
             while i <= mid:
                 merged.append(arr[i])
                 i += 1
-                yield arr, None, finalized.copy()
+                yield arr, None, finalized
             while j <= right:
                 merged.append(arr[j])
                 j += 1
-                yield arr, None, finalized.copy()
+                yield arr, None, finalized
             for k in range(len(merged)):
                 arr[left + k] = merged[k]
-                yield arr, (left + k, None), finalized.copy()
+                yield arr, (left + k, None), finalized
             if curr_size * 2 >= n:
                 for idx in range(left, min(left + len(merged), n)):
-                    if idx not in finalized:
-                        finalized.append(idx)
+                    finalized.add(idx)
         curr_size *= 2
-    all_indices = set(range(len(arr)))
-    missing = all_indices - set(finalized)
-    if missing:
-        finalized.extend(missing)
+    if len(finalized) < len(arr):
+        finalized.fill()
         yield arr, None, finalized
 
 
@@ -354,6 +426,7 @@ def merge_visual(left, right):
 def tim_sort_visual(arr):
     min_run = 32
     n = len(arr)
+    finalized = FinalizedSet(n)
 
     # Sort individual subarrays of size min_run
     for i in range(0, n, min_run):
@@ -372,20 +445,21 @@ def tim_sort_visual(arr):
                 # Merge using the visual merge function
                 merge_gen = merge_visual(left, right)
                 merged = []
-                for merged_state, indices, finalized in merge_gen:
+                for merged_state, indices, _ in merge_gen:
                     merged = merged_state
                     # Yield the original array state; indices are illustrative
-                    yield arr, indices, []
+                    yield arr, indices, finalized
 
                 # Copy merged result back to arr, yielding each step
                 for k, val in enumerate(merged):
                     arr[start + k] = val
-                    yield arr, (start + k, None), []
+                    yield arr, (start + k, None), finalized
 
         size *= 2
 
     # Final yield with all indices finalized
-    yield arr, None, list(range(n))
+    finalized.fill()
+    yield arr, None, finalized
 
 # ----- Array Presets and Custom Generation -----
 def generate_array(preset, n, min_val, max_val):
@@ -428,8 +502,358 @@ def generate_array(preset, n, min_val, max_val):
     else:
         return [random.uniform(min_val, max_val) for _ in range(n)]
 
+# ----- Rendering -----
+# Rendered value labels, most recently used last. Rasterising text is the
+# slowest call in the draw loop and a sort only permutes values, so the
+# same few hundred labels are drawn over and over.
+LABEL_CACHE_SIZE = 2048
+label_cache = OrderedDict()
+
+def render_label(font, text):
+    key = (id(font), text)
+    surf = label_cache.get(key)
+    if surf is not None:
+        label_cache.move_to_end(key)
+        return surf
+    surf = font.render(text, True, gruvbox["fg"])
+    label_cache[key] = surf
+    if len(label_cache) > LABEL_CACHE_SIZE:
+        label_cache.popitem(last=False)
+    return surf
+
+def draw_array(surface, font, arr, section_x, section_width, vis_top, vis_bottom,
+               highlight, finalized, complete, show_values, value_range=None, dirty=None):
+    """
+    Draw the bars of one array section.
+
+    With dirty=None every bar is drawn. Otherwise only the columns of the
+    given indices are cleared and redrawn (along with any neighbouring bars
+    sharing their pixels) and the list of touched rects is returned, ready
+    for pygame.display.update. value_range=(min, max) avoids rescanning the
+    array, which a sort only permutes.
+    """
+    n = len(arr)
+    if n == 0:
+        return []
+    vis_height = vis_bottom - vis_top
+    bar_width = section_width / n
+    arr_min, arr_max = value_range if value_range is not None else (min(arr), max(arr))
+    full_range = arr_max - arr_min if arr_max - arr_min != 0 else 1
+    baseline = vis_bottom - ((0 - arr_min) / full_range) * vis_height
+    baseline_rect = pygame.Rect(int(section_x), int(baseline) - 1,
+                                int(section_x + section_width) - int(section_x), 2)
+    # The extremes have the longest labels; if even the shorter of those
+    # does not fit a bar, no label will
+    if show_values:
+        show_values = bar_width >= min(render_label(font, f"{arr_min:.2f}").get_width(),
+                                       render_label(font, f"{arr_max:.2f}").get_width())
+
+    def draw_bar(i):
+        val = arr[i]
+        bar_height = abs(val) / full_range * vis_height
+        x = section_x + i * bar_width
+        if val >= 0:
+            y = baseline - bar_height
+        else:
+            y = baseline
+        if i in finalized:
+            color = gruvbox["blue"]
+        elif highlight is not None and (i == highlight[0] or
+                                        (highlight[1] is not None and i == highlight[1])):
+            color = gruvbox["red"]
+        else:
+            color = gruvbox["green"]
+        if complete:
+            color = gruvbox["blue"]
+        pygame.draw.rect(surface, color, (x, y, max(1, bar_width - 1), bar_height))
+        if show_values:
+            val_text = render_label(font, f"{val:.2f}")
+            # Labels wider than their bar would overlap the neighbours
+            if val_text.get_width() > bar_width:
+                return
+            text_x = x + (bar_width - val_text.get_width()) / 2
+            text_y = y - val_text.get_height() - 5 if val >= 0 else y + bar_height + 5
+            surface.blit(val_text, (text_x, text_y))
+
+    if dirty is None:
+        surface.fill(gruvbox["fg"], baseline_rect)
+        for i in range(n):
+            draw_bar(i)
+        return None
+
+    # Vertical extent any bar can cover (bars start at the baseline, which
+    # lies outside the section when all values share a sign)
+    col_top = int(min(vis_top, baseline - max(arr_max, 0) / full_range * vis_height)) - 1
+    col_bottom = int(max(vis_bottom, baseline + max(-arr_min, 0) / full_range * vis_height)) + 2
+
+    rects = []
+    for i in sorted(set(i for i in dirty if i is not None and 0 <= i < n)):
+        # Pixel columns owned by bar i (at least one pixel wide)
+        x0 = int(section_x + i * bar_width)
+        x1 = max(x0 + 1, int(section_x + (i + 1) * bar_width))
+        column = pygame.Rect(x0, col_top, x1 - x0, col_bottom - col_top)
+        surface.fill(gruvbox["bg"], column)
+        surface.fill(gruvbox["fg"], column.clip(baseline_rect))
+        # Bars narrower than a pixel share columns: redraw (in order) every
+        # bar that starts inside the cleared column
+        first = max(0, int((x0 - section_x) / bar_width) - 1)
+        last = min(n - 1, int((x1 - section_x) / bar_width) + 1)
+        for j in range(first, last + 1):
+            if x0 <= int(section_x + j * bar_width) < x1:
+                draw_bar(j)
+        rects.append(column)
+    return rects
+
+# ----- Headless Recording -----
+# Delta log layout: header (magic, element count), the initial array as
+# doubles, then one record per step: highlighted indices (-1 for none), the
+# number of changed elements and (index, new value) for each of them
+LOG_MAGIC = b"SVL1"
+LOG_HEADER = struct.Struct("<4sI")
+LOG_STEP = struct.Struct("<iiB")
+LOG_CHANGE = struct.Struct("<Id")
+
+visual_generators = {
+    "Quick Sort": quick_sort_visual,
+    "Merge Sort": merge_sort_visual,
+    "Heap Sort": heap_sort_visual,
+    "Insertion Sort": insertion_sort_visual,
+    "Tim Sort": tim_sort_visual,
+}
+
+def record_headless(algo_name, base_array, out_dir, font, write_frames, frame_every,
+                    width, height, show_values):
+    """
+    Drive one visual generator as fast as possible, writing a per-step delta
+    log and optionally PNG frames, without a display or any delays.
+
+    Every write the generators make is at one of the indices they yield, so
+    comparing only the highlighted positions against a shadow copy finds all
+    changes of a step in O(1).
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    arr = list(base_array)
+    shadow = list(base_array)
+    n = len(arr)
+    surface = pygame.Surface((width, height)) if write_frames else None
+    margin = 20
+
+    steps = 0
+    frames = 0
+    finalized = []
+    highlight = None
+    with open(os.path.join(out_dir, "steps.svl"), "wb") as log:
+        log.write(LOG_HEADER.pack(LOG_MAGIC, n))
+        log.write(struct.pack(f"<{n}d", *arr))
+
+        for arr_state, highlight, finalized in visual_generators[algo_name](arr):
+            changes = []
+            if highlight is not None:
+                for i in highlight:
+                    if i is not None and 0 <= i < n and arr[i] != shadow[i]:
+                        shadow[i] = arr[i]
+                        changes.append((i, arr[i]))
+            h0 = highlight[0] if highlight is not None and highlight[0] is not None else -1
+            h1 = highlight[1] if highlight is not None and highlight[1] is not None else -1
+            log.write(LOG_STEP.pack(h0, h1, len(changes)))
+            for i, val in changes:
+                log.write(LOG_CHANGE.pack(i, val))
+
+            if surface is not None and steps % frame_every == 0:
+                surface.fill(gruvbox["bg"])
+                draw_array(surface, font, arr, margin, width - 2 * margin, margin, height - margin,
+                           highlight, finalized, False, show_values)
+                pygame.image.save(surface, os.path.join(out_dir, f"frame_{frames:06d}.png"))
+                frames += 1
+            steps += 1
+
+    if surface is not None:
+        surface.fill(gruvbox["bg"])
+        draw_array(surface, font, arr, margin, width - 2 * margin, margin, height - margin,
+                   None, [], True, show_values)
+        pygame.image.save(surface, os.path.join(out_dir, f"frame_{frames:06d}.png"))
+        frames += 1
+
+    return steps, frames
+
+def run_headless():
+    if args.seed is not None:
+        random.seed(args.seed)
+    base_array = generate_array(args.preset, args.size, args.min_value, args.max_value)
+    headless_font = pygame.font.SysFont("Arial", 14)
+    algos = list(visual_generators) if args.algorithm == "All" else [args.algorithm]
+    for algo_name in algos:
+        if algo_name not in visual_generators:
+            print(f"Unknown algorithm: {algo_name}")
+            sys.exit(1)
+        out_dir = os.path.join(args.out, algo_name.replace(' ', '_'))
+        steps, frames = record_headless(algo_name, base_array, out_dir, headless_font, args.frames,
+                                        max(1, args.frame_every), args.width, args.height,
+                                        args.show_values)
+        print(f"{algo_name}: {steps} steps, {frames} frames -> {out_dir}")
+
+# ----- Traces -----
+# A full copy of the array is kept every SNAPSHOT_INTERVAL steps
+SNAPSHOT_INTERVAL = 1024
+
+class Trace:
+    """
+    A recorded run of one *_visual generator that can be replayed from any
+    step, forwards or backwards, without sorting again.
+
+    Each step stores its highlight pair, the writes it made as packed
+    (index, old, new) records and how many indices were finalized after it.
+    Writes only ever land on the yielded indices, so recording diffs those
+    against a shadow copy. Seeking replays writes from the current position
+    or from the nearest snapshot, whichever is closer.
+
+    pos is the number of steps applied; arr and finalized hold the state at
+    pos and are updated in place.
+    """
+
+    def __init__(self, base_array, generator_func):
+        n = len(base_array)
+        self.highlights = array("i")
+        self.write_offsets = array("I", [0])
+        self.write_index = array("I")
+        self.write_old = array("d")
+        self.write_new = array("d")
+        self.finalized_counts = array("I")
+        self.snapshots = [array("d", base_array)]
+
+        work = list(base_array)
+        shadow = list(base_array)
+        finalized = None
+        for _, highlight, finalized in generator_func(work):
+            h0 = highlight[0] if highlight is not None and highlight[0] is not None else -1
+            h1 = highlight[1] if highlight is not None and highlight[1] is not None else -1
+            for i in (h0, h1):
+                if 0 <= i < n and work[i] != shadow[i]:
+                    self.write_index.append(i)
+                    self.write_old.append(shadow[i])
+                    self.write_new.append(work[i])
+                    shadow[i] = work[i]
+            self.highlights.append(h0)
+            self.highlights.append(h1)
+            self.write_offsets.append(len(self.write_index))
+            self.finalized_counts.append(len(finalized))
+            if len(self.finalized_counts) % SNAPSHOT_INTERVAL == 0:
+                self.snapshots.append(array("d", shadow))
+        self.finalized_order = array("I", finalized.added if finalized is not None else [])
+
+        self.pos = 0
+        self.arr = list(base_array)
+        self.finalized = FinalizedSet(n)
+
+    def __len__(self):
+        return len(self.finalized_counts)
+
+    @property
+    def highlight(self):
+        if self.pos == 0:
+            return None
+        h0 = self.highlights[2 * self.pos - 2]
+        h1 = self.highlights[2 * self.pos - 1]
+        if h0 < 0 and h1 < 0:
+            return None
+        return (h0 if h0 >= 0 else None, h1 if h1 >= 0 else None)
+
+    def seek(self, pos):
+        """
+        Move to step pos (clamped to the trace).
+
+        Returns:
+            The indices whose bar changed height or colour, or None if the
+            whole array was restored from a snapshot
+        """
+        pos = max(0, min(pos, len(self)))
+        highlights = self.highlights
+        changed = []
+        if self.pos > 0:
+            changed += highlights[2 * self.pos - 2:2 * self.pos]
+
+        # Only a seek further than half the interval can start closer from a snapshot
+        if abs(pos - self.pos) > SNAPSHOT_INTERVAL // 2:
+            snap = min((pos + SNAPSHOT_INTERVAL // 2) // SNAPSHOT_INTERVAL, len(self.snapshots) - 1)
+            if abs(pos - snap * SNAPSHOT_INTERVAL) < abs(pos - self.pos):
+                self.arr[:] = self.snapshots[snap]
+                self.pos = snap * SNAPSHOT_INTERVAL
+                changed = None
+
+        arr = self.arr
+        start, end = self.write_offsets[self.pos], self.write_offsets[pos]
+        if pos > self.pos:
+            for w in range(start, end):
+                arr[self.write_index[w]] = self.write_new[w]
+        else:
+            for w in range(start - 1, end - 1, -1):
+                arr[self.write_index[w]] = self.write_old[w]
+        self.pos = pos
+
+        before = len(self.finalized)
+        count = self.finalized_counts[pos - 1] if pos > 0 else 0
+        if count > before:
+            for i in self.finalized_order[before:count]:
+                self.finalized.add(i)
+        elif count < before:
+            self.finalized.truncate(count)
+
+        if changed is None:
+            return None
+        changed += self.write_index[min(start, end):max(start, end)]
+        if count != before:
+            changed += self.finalized_order[min(before, count):max(before, count)]
+        if pos > 0:
+            changed += highlights[2 * pos - 2:2 * pos]
+        # -1 marks an empty highlight slot
+        return [i for i in changed if i >= 0]
+
+# ----- Playback -----
+# Frames are paced by the clock; the delay slider sets animation time per
+# step, so several steps may run between two frames. Stepping stops once it
+# has used FRAME_BUDGET_MS of a frame and the remaining backlog is dropped,
+# which keeps the frame rate steady however slow the algorithm is.
+TARGET_FPS = 60
+FRAME_BUDGET_MS = 1000 * 2 // (3 * TARGET_FPS)
+# Steps replayed per seek between two checks of the frame budget
+STEP_CHUNK = 64
+
+def seek_trace(i, pos, track_dirty=True):
+    """
+    Move trace i to step pos, updating its highlight and completion state
+    and (with track_dirty) the bars to redraw.
+
+    Returns:
+        True if the move needs a full redraw (the trace was restored from a
+        snapshot or the sort became complete or incomplete)
+    """
+    trace = traces[i]
+    changed = trace.seek(pos)
+    highlight_indices_list[i] = trace.highlight
+    complete = trace.pos == len(trace)
+    if complete and end_ticks[i] is None:
+        end_ticks[i] = pygame.time.get_ticks()
+    full = changed is None or complete != sorting_complete[i]
+    sorting_complete[i] = complete
+    if not full and track_dirty:
+        dirty_indices[i].extend(changed)
+    return full
+
+def seek_all(pos):
+    """Move every trace to step pos; returns True if a full redraw is needed"""
+    full = False
+    for i in range(len(traces)):
+        if seek_trace(i, pos):
+            full = True
+    return full
+
 # ----- Pygame Setup -----
 sys.setrecursionlimit(99999)
+if args.headless:
+    run_headless()
+    pygame.quit()
+    sys.exit()
+
 infoObject = pygame.display.Info()
 WIDTH, HEIGHT = infoObject.current_w, infoObject.current_h
 screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.FULLSCREEN)
@@ -454,7 +878,10 @@ algorithm_dropdown = Dropdown(ui_margin, 100, dropdown_width, dropdown_height, a
 preset_dropdown = Dropdown(ui_margin + dropdown_width + 20, 100, dropdown_width, dropdown_height, preset_options, font)
 sort_button = Button(ui_margin + 2 * (dropdown_width + 20), 100, button_width, button_height, "SORT", font)
 reset_button = Button(ui_margin + 2 * (dropdown_width + 20) + button_width + 20, 100, button_width, button_height, "RESET", font)
-speed_slider = Slider(ui_margin + 2 * (dropdown_width + 20) + 2 * (button_width + 20), 100, slider_width, button_height, 5, 100, 30, "Delay (ms)", font)
+speed_slider = Slider(ui_margin + 2 * (dropdown_width + 20) + 2 * (button_width + 20), 100, slider_width, button_height, 0, 100, 30, "Delay (ms)", font)
+end_button = Button(ui_margin + 2 * (dropdown_width + 20) + 2 * (button_width + 20) + slider_width + 20, 100, button_width, button_height, "END", font)
+reverse_button = Button(ui_margin + 2 * (dropdown_width + 20) + 3 * (button_width + 20) + slider_width + 20, 100, button_width, button_height, "REVERSE", font)
+timeline_slider = Slider(ui_margin + 3 * (input_width + 20) + 20, 50, 2 * slider_width, button_height, 0, 1, 0, "Step", font)
 num_elements_box = InputBox(ui_margin, 50, input_width, input_height, "50", font, "Array Size")
 min_value_box = InputBox(ui_margin + input_width + 20, 50, input_width, input_height, "-10.0", font, "Min Value")
 max_value_box = InputBox(ui_margin + 2 * (input_width + 20), 50, input_width, input_height, "100.0", font, "Max Value")
@@ -466,17 +893,28 @@ arrays = [generate_array(preset_options[preset_dropdown.selected],
                          int(num_elements_box.text),
                          float(min_value_box.text),
                          float(max_value_box.text))]
-generators = []
+timeline_moved = False
+# One recorded trace per array; playback moves through them in play_direction
+traces = []
+play_direction = 1
 highlight_indices_list = [None]
 finalized_indices_list = [[]]
 sorting_complete = [False]
 sorting_in_progress = False
 start_ticks = []
 end_ticks = []
+# Incremental rendering state: cached (min, max) per array, indices to
+# redraw per array, and whether the next frame must be drawn in full
+value_ranges = []
+dirty_indices = [[]]
+full_redraw = True
+# Steps owed to the animation, accumulated from frame time / delay
+step_credit = 0.0
 
 # ----- Main Loop -----
 while True:
-    for event in pygame.event.get():
+    events = pygame.event.get()
+    for event in events:
         if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
             pygame.quit()
             sys.exit()
@@ -509,40 +947,57 @@ while True:
 
             base_array = generate_array(preset_options[preset_dropdown.selected], n, min_val, max_val)
 
+            # Record every step up front; playback then only replays the traces
             if algorithm_dropdown.selected == 5:  # "All"
                 all_mode = True
-                arrays = [base_array.copy() for _ in range(5)]
-                generators = [
-                    quick_sort_visual(arrays[0]),
-                    merge_sort_visual(arrays[1]),
-                    heap_sort_visual(arrays[2]),
-                    insertion_sort_visual(arrays[3]),
-                    tim_sort_visual(arrays[4])
-                ]
-                highlight_indices_list = [None] * 5
-                finalized_indices_list = [[] for _ in range(5)]
-                sorting_complete = [False] * 5
+                algos = algo_options[:5]
             else:
                 all_mode = False
-                arrays = [base_array]
-                algo = algo_options[algorithm_dropdown.selected]
-                if algo == "Quick Sort":
-                    generators = [quick_sort_visual(arrays[0])]
-                elif algo == "Merge Sort":
-                    generators = [merge_sort_visual(arrays[0])]
-                elif algo == "Heap Sort":
-                    generators = [heap_sort_visual(arrays[0])]
-                elif algo == "Insertion Sort":
-                    generators = [insertion_sort_visual(arrays[0])]
-                elif algo == "Tim Sort":
-                    generators = [tim_sort_visual(arrays[0])]
-                highlight_indices_list = [None]
-                finalized_indices_list = [[]]
-                sorting_complete = [False]
+                algos = [algo_options[algorithm_dropdown.selected]]
+            traces = [Trace(base_array, visual_generators[algo]) for algo in algos]
+            arrays = [trace.arr for trace in traces]
+            highlight_indices_list = [None] * len(traces)
+            finalized_indices_list = [trace.finalized for trace in traces]
+            sorting_complete = [False] * len(traces)
+            timeline_slider.max_val = max(1, max(len(trace) for trace in traces))
+            timeline_slider.value = 0
             start_ticks = [pygame.time.get_ticks()] * len(arrays)
             end_ticks = [None] * len(arrays)
+            value_ranges = [(min(arr), max(arr)) if arr else (0, 0) for arr in arrays]
+            dirty_indices = [[] for _ in arrays]
+            step_credit = 0.0
+            play_direction = 1
+            sorting_in_progress = True
+
+        # Jump to end: seek straight to the last step without drawing
+        if end_button.is_clicked(event) and traces:
+            seek_all(timeline_slider.max_val)
+            sorting_in_progress = False
+
+        # Play backwards from the current step (or forwards again)
+        if reverse_button.is_clicked(event) and traces:
+            play_direction = -play_direction
+            step_credit = 0.0
             sorting_in_progress = True
 
+        # Dragging the timeline pauses playback and seeks every trace
+        timeline_slider.handle_event(event)
+        if timeline_slider.dragging and traces:
+            sorting_in_progress = False
+            seek_all(timeline_slider.value)
+
+        # Space plays/pauses, arrow keys step back and forth while paused
+        typing = num_elements_box.active or min_value_box.active or max_value_box.active
+        if event.type == pygame.KEYDOWN and traces and not typing:
+            if event.key == pygame.K_SPACE:
+                sorting_in_progress = not sorting_in_progress
+                step_credit = 0.0
+            elif event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+                sorting_in_progress = False
+                step = 1 if event.key == pygame.K_RIGHT else -1
+                for i in range(len(traces)):
+                    seek_trace(i, traces[i].pos + step)
+
         if reset_button.is_clicked(event):
             sorting_in_progress = False
             all_mode = False
@@ -558,30 +1013,47 @@ while True:
                 num_elements_box.text = str(n)
                 num_elements_box.txt_surface = font.render(num_elements_box.text, True, gruvbox["fg"])
             arrays = [generate_array(preset_options[preset_dropdown.selected], n, min_val, max_val)]
-            generators = []
+            traces = []
             highlight_indices_list = [None]
             finalized_indices_list = [[]]
             sorting_complete = [False]
+            value_ranges = [(min(arr), max(arr)) if arr else (0, 0) for arr in arrays]
+            dirty_indices = [[]]
 
-    screen.fill(gruvbox["bg"])
+    # Anything other than sorting progress (UI input, open dropdowns, sort
+    # start/finish) redraws the whole screen; otherwise only dirty bars
+    if events or algorithm_dropdown.active or preset_dropdown.active:
+        full_redraw = True
 
-    # Sorting step
+    # Sorting steps: as many as the delay asks for since the last frame,
+    # within the frame budget, all drawn together afterwards
     if sorting_in_progress:
-        for i in range(len(generators)):
-            if not sorting_complete[i]:
-                try:
-                    arrays[i], highlight_indices_list[i], finalized_indices_list[i] = next(generators[i])
-                    if len(finalized_indices_list[i]) == len(arrays[i]):
-                        sorting_complete[i] = True
-                        end_ticks[i] = pygame.time.get_ticks()
-                except StopIteration:
-                    sorting_complete[i] = True
-                    end_ticks[i] = pygame.time.get_ticks()
-                    highlight_indices_list[i] = None
-                    finalized_indices_list[i] = list(range(len(arrays[i])))
-        pygame.time.delay(speed_slider.value)
-        if all(sorting_complete):
-            sorting_in_progress = False
+        if speed_slider.value > 0:
+            step_credit += clock.get_time() / speed_slider.value
+        else:
+            step_credit = float("inf")
+        deadline = pygame.time.get_ticks() + FRAME_BUDGET_MS
+        while step_credit >= 1:
+            # Steps within a chunk are never drawn, so one seek covers them all
+            chunk = int(min(step_credit, STEP_CHUNK))
+            for i in range(len(traces)):
+                if seek_trace(i, traces[i].pos + chunk * play_direction):
+                    full_redraw = True
+            step_credit -= chunk
+            if all(trace.pos == (len(trace) if play_direction > 0 else 0) for trace in traces):
+                sorting_in_progress = False
+                step_credit = 0.0
+            elif pygame.time.get_ticks() >= deadline:
+                step_credit = 0.0
+        # Past a point redrawing single bars costs more than a full frame
+        if any(len(dirty) > len(arr) for dirty, arr in zip(dirty_indices, arrays)):
+            full_redraw = True
+
+    if traces and not timeline_slider.dragging:
+        position = max(trace.pos for trace in traces)
+        if position != timeline_slider.value:
+            timeline_slider.value = position
+            timeline_moved = True
 
     # ----- Draw Array Visualization -----
     vis_top = 160
@@ -596,8 +1068,27 @@ while True:
         spacing = 0
         section_width = total_width
 
+    if len(value_ranges) != len(arrays):
+        value_ranges = [(min(arr), max(arr)) if arr else (0, 0) for arr in arrays]
+
+    # Value labels spill over neighbouring columns, so they need full frames
+    if checkbox.checked and sorting_in_progress:
+        full_redraw = True
+
+    if full_redraw:
+        screen.fill(gruvbox["bg"])
+
+    update_rects = []
     for idx in range(len(arrays)):
         section_x = ui_margin + idx * (section_width + spacing)
+        if not full_redraw:
+            if dirty_indices[idx]:
+                update_rects += draw_array(screen, font, arrays[idx], section_x, section_width, vis_top,
+                                           vis_bottom, highlight_indices_list[idx], finalized_indices_list[idx],
+                                           sorting_complete[idx], checkbox.checked, value_ranges[idx],
+                                           dirty=dirty_indices[idx])
+            continue
+
         if all_mode:
             algo_name = algo_options[idx]
         else:
@@ -606,37 +1097,9 @@ while True:
         name_rect = name_surf.get_rect(center=(section_x + section_width / 2, vis_top - 20))
         screen.blit(name_surf, name_rect)
 
-        arr = arrays[idx]
-        n = len(arr)
-        if n > 0:
-            bar_width = section_width / n
-            arr_min = min(arr)
-            arr_max = max(arr)
-            full_range = arr_max - arr_min if arr_max - arr_min != 0 else 1
-            baseline = vis_bottom - ((0 - arr_min) / full_range) * vis_height
-            pygame.draw.line(screen, gruvbox["fg"], (section_x, baseline), (section_x + section_width, baseline), 2)
-            for i, val in enumerate(arr):
-                bar_height = abs(val) / full_range * vis_height
-                x = section_x + i * bar_width
-                if val >= 0:
-                    y = baseline - bar_height
-                else:
-                    y = baseline
-                if i in finalized_indices_list[idx]:
-                    color = gruvbox["blue"]
-                elif highlight_indices_list[idx] is not None and (i == highlight_indices_list[idx][0] or
-                                                                  (highlight_indices_list[idx][1] is not None and i == highlight_indices_list[idx][1])):
-                    color = gruvbox["red"]
-                else:
-                    color = gruvbox["green"]
-                if sorting_complete[idx]:
-                    color = gruvbox["blue"]
-                pygame.draw.rect(screen, color, (x, y, max(1, bar_width - 1), bar_height))
-                if checkbox.checked:  # Add this block
-                    val_text = font.render(f"{val:.2f}", True, gruvbox["fg"])
-                    text_x = x + (bar_width - val_text.get_width()) / 2
-                    text_y = y - val_text.get_height() - 5 if val >= 0 else y + bar_height + 5
-                    screen.blit(val_text, (text_x, text_y))
+        draw_array(screen, font, arrays[idx], section_x, section_width, vis_top, vis_bottom,
+                   highlight_indices_list[idx], finalized_indices_list[idx], sorting_complete[idx],
+                   checkbox.checked, value_ranges[idx])
         if sorting_complete[idx] and end_ticks[idx] is not None:
             elapsed_time = (end_ticks[idx] - start_ticks[idx]) / 1000.0
             time_text = f"Time: {elapsed_time:.2f} s"
@@ -647,16 +1110,33 @@ while True:
             text_rect = text_surf.get_rect(center=(section_x + section_width / 2, vis_top + vis_height / 2))
             screen.blit(text_surf, text_rect)
 
-    algorithm_dropdown.draw(screen)
-    preset_dropdown.draw(screen)
-    sort_button.draw(screen)
-    reset_button.draw(screen)
-    speed_slider.draw(screen)
-    num_elements_box.draw(screen)
-    min_value_box.draw(screen)
-    max_value_box.draw(screen)
-    exit_button.draw(screen)
-    checkbox.draw(screen)
-
-    pygame.display.flip()
-    clock.tick(60)
\ No newline at end of file
+    if full_redraw:
+        algorithm_dropdown.draw(screen)
+        preset_dropdown.draw(screen)
+        sort_button.draw(screen)
+        reset_button.draw(screen)
+        end_button.draw(screen)
+        reverse_button.draw(screen)
+        timeline_slider.draw(screen)
+        speed_slider.draw(screen)
+        num_elements_box.draw(screen)
+        min_value_box.draw(screen)
+        max_value_box.draw(screen)
+        exit_button.draw(screen)
+        checkbox.draw(screen)
+        pygame.display.flip()
+    else:
+        if timeline_moved:
+            # Label above the track and the knob overhanging both ends
+            r = timeline_slider.rect
+            area = pygame.Rect(r.x - r.height, r.y - 25, r.width + 2 * r.height, r.height + 25)
+            screen.fill(gruvbox["bg"], area)
+            timeline_slider.draw(screen)
+            update_rects.append(area)
+        if update_rects:
+            pygame.display.update(update_rects)
+
+    full_redraw = False
+    timeline_moved = False
+    dirty_indices = [[] for _ in arrays]
+    clock.tick(TARGET_FPS)
\ No newline at end of file
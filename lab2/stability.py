@@ -0,0 +1,109 @@
+from heap_sort import heap_sort
+from quick_sort import quick_sort
+
+
+class TaggedItem:
+    """
+    Element tagged with its original index.
+
+    Comparisons look at the value only, so a sort behaves exactly as on the
+    plain input, while the tags let the result be checked for stability.
+    """
+
+    __slots__ = ("value", "index")
+
+    def __init__(self, value, index):
+        self.value = value
+        self.index = index
+
+    def __lt__(self, other):
+        return self.value < other.value
+
+    def __le__(self, other):
+        return self.value <= other.value
+
+    def __gt__(self, other):
+        return self.value > other.value
+
+    def __ge__(self, other):
+        return self.value >= other.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __ne__(self, other):
+        return self.value != other.value
+
+    __hash__ = None
+
+
+def check_sorted(result, n, check_stability):
+    """
+    Check a sorted list of TaggedItems in one O(n) pass.
+
+    Args:
+        result: The list after sorting
+        n: Length of the original input
+        check_stability: Also require equal values to keep their input order
+
+    Returns:
+        error: Description of the first problem found, or None if the output is valid
+    """
+    if len(result) != n:
+        return f"length changed from {n} to {len(result)}"
+
+    seen = bytearray(n)
+    prev = None
+    for k, item in enumerate(result):
+        if not isinstance(item, TaggedItem) or not 0 <= item.index < n or seen[item.index]:
+            return f"position {k} does not hold a distinct input element"
+        seen[item.index] = 1
+        if prev is not None:
+            if item.value < prev.value:
+                return f"not sorted at position {k}: {prev.value!r} before {item.value!r}"
+            if check_stability and item.index < prev.index and not prev.value < item.value:
+                return f"not stable at position {k}: equal values {prev.value!r} out of input order"
+        prev = item
+    return None
+
+
+def verify_sort(sort_func, arr):
+    """
+    Sort an index-tagged copy of arr and verify sortedness (and stability when
+    sort_func declares itself stable through a `stable` attribute).
+
+    Returns:
+        error: Description of the first problem found, or None if the sort is correct
+    """
+    tagged = [TaggedItem(v, i) for i, v in enumerate(arr)]
+    sort_func(tagged)
+    return check_sorted(tagged, len(arr), getattr(sort_func, "stable", False))
+
+
+def make_stable(sort_func):
+    """
+    Stable variant of an unstable in-place sort.
+
+    Each element is decorated with its index so ties are broken by input
+    order; this costs one O(n) pass and a list of pairs on top of the sort.
+    """
+    def stable_sort(arr):
+        decorated = [(v, i) for i, v in enumerate(arr)]
+        sort_func(decorated)
+        arr[:] = [v for v, _ in decorated]
+        return arr
+
+    stable_sort.stable = True
+    stable_sort.__name__ = f"stable_{sort_func.__name__}"
+    return stable_sort
+
+
+def _quick_sort_full(arr):
+    quick_sort(arr, 0, len(arr) - 1)
+
+
+_quick_sort_full.__name__ = "quick_sort"
+
+# Stable variants of the unstable engines
+stable_heap_sort = make_stable(heap_sort)
+stable_quick_sort = make_stable(_quick_sort_full)
@@ -0,0 +1,261 @@
+import json
+import multiprocessing as mp
+import os
+import sys
+import time
+
+from instrumentation import count_operations
+from stability import verify_sort
+
+
+# Status values stored for every cell of the sweep
+STATUS_OK = "ok"
+STATUS_TIMEOUT = "timeout"
+STATUS_ERROR = "error"
+STATUS_INVALID = "invalid"
+
+# Message a worker sends with its timings, ahead of the final status
+_TIMES = "times"
+
+
+def cell_key(sort_name, pattern_name, n):
+    """Key identifying one (algorithm, pattern, size) cell of the sweep"""
+    return f"{sort_name}|{pattern_name}|{n}"
+
+
+def load_checkpoint(path):
+    """
+    Load finished cells from a checkpoint file.
+
+    Args:
+        path: Path to a JSON-lines checkpoint (may not exist yet)
+
+    Returns:
+        done: Dictionary mapping cell_key -> cell record
+    """
+    done = {}
+    if path is None or not os.path.exists(path):
+        return done
+
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A partially written last line from an interrupted run
+                continue
+            done[cell_key(record["algorithm"], record["pattern"], record["size"])] = record
+    return done
+
+
+def append_checkpoint(path, record):
+    """Append one finished cell to the checkpoint file and flush it to disk"""
+    if path is None:
+        return
+    with open(path, "a") as f:
+        f.write(json.dumps(record) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _run_cell(conn, sort_func, arr, num_runs, instrument, verify):
+    """
+    Worker process body: time sort_func on copies of arr num_runs times, then
+    optionally verify the output and count operations in extra untimed runs.
+
+    The timings are sent as soon as they are measured. The untimed checks
+    work on proxy objects and are many times slower than the sort itself,
+    so they run under a budget of their own and overrunning it must not
+    lose the timings.
+    """
+    sys.setrecursionlimit(99999999)
+    try:
+        times = []
+        for _ in range(num_runs):
+            arr_copy = arr.copy()
+            start = time.perf_counter()
+            sort_func(arr_copy)
+            times.append(time.perf_counter() - start)
+        conn.send((_TIMES, times))
+        if verify:
+            error = verify_sort(sort_func, arr)
+            if error is not None:
+                conn.send((STATUS_INVALID, error))
+                return
+        counts = count_operations(sort_func, arr) if instrument else None
+        conn.send((STATUS_OK, counts))
+    except BaseException as e:
+        conn.send((STATUS_ERROR, repr(e)))
+    finally:
+        conn.close()
+
+
+def _make_record(sort_name, pattern_name, n, status, times=None, counts=None, error=None, elapsed=None):
+    return {
+        "algorithm": sort_name,
+        "pattern": pattern_name,
+        "size": n,
+        "status": status,
+        "avg_time": sum(times) / len(times) if times else float('nan'),
+        "runs": len(times) if times else 0,
+        "times": times or [],
+        "counts": counts,
+        "error": error,
+        "elapsed": elapsed,
+    }
+
+
+def run_sweep(cells, timeout=60.0, workers=None, checkpoint_path=None, on_result=None, instrument=False,
+              verify=False, resume=False, check_timeout=None):
+    """
+    Run benchmark cells in parallel worker processes with a per-cell time budget.
+
+    Every cell runs in its own process so that a cell exceeding `timeout`
+    seconds can be killed outright and recorded as a timeout. Verification
+    and instrumentation start after the timed runs, with a fresh budget of
+    `check_timeout` seconds; a cell whose checks overrun it keeps its
+    timings and is recorded as ok with an error note. Finished cells
+    are appended to `checkpoint_path` as they complete. With resume=True the
+    cells already present there are skipped, so an interrupted sweep carries
+    on where it stopped; otherwise any old checkpoint is discarded first.
+    The checkpoint is deleted once the sweep completes, so finished results
+    are never replayed into a later run.
+
+    Args:
+        cells: Iterable of (sort_name, sort_func, pattern_name, n, arr, num_runs)
+        timeout: Seconds a single cell may run before it is killed
+        workers: Number of concurrent processes (defaults to the CPU count)
+        checkpoint_path: JSON-lines file for finished cells, or None to disable
+        on_result: Optional callback invoked with every new cell record
+        instrument: Also record comparison/write/allocation counts per cell
+        verify: Check every cell's output for sortedness (and stability for
+                sorts declaring `stable = True`); failures are marked invalid
+        resume: Reuse the cells recorded in checkpoint_path by an interrupted
+                sweep (the caller vouches that the code has not changed since)
+        check_timeout: Seconds allowed for verification and instrumentation
+                after the timed runs (defaults to timeout)
+
+    Returns:
+        results: Dictionary mapping cell_key -> cell record (including resumed ones)
+    """
+    workers = workers or os.cpu_count() or 1
+    if check_timeout is None:
+        check_timeout = timeout
+    if resume:
+        results = load_checkpoint(checkpoint_path)
+    else:
+        results = {}
+        if checkpoint_path is not None and os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+
+    pending = []
+    for c in cells:
+        record = results.get(cell_key(c[0], c[2], c[3]))
+        # Re-run finished cells measured with another number of runs, or that
+        # lack (current) counts when instrumentation is requested
+        if (record is None
+                or (record["status"] == STATUS_OK and record["runs"] != c[5])
+                or (instrument and record["status"] == STATUS_OK
+                    and "input_writes" not in (record.get("counts") or {}))):
+            pending.append(c)
+
+    # Fork keeps worker start-up cheap where available
+    methods = mp.get_all_start_methods()
+    ctx = mp.get_context("fork" if "fork" in methods else "spawn")
+
+    # Each job is [process, parent_conn, cell, start_time, deadline, times]
+    running = []
+    next_cell = 0
+
+    def finish(cell, record):
+        results[cell_key(cell[0], cell[2], cell[3])] = record
+        append_checkpoint(checkpoint_path, record)
+        if on_result is not None:
+            on_result(record)
+
+    def receive(job):
+        """Read the job's pending messages; return its final (status, payload) if sent"""
+        conn = job[1]
+        while conn.poll():
+            try:
+                kind, payload = conn.recv()
+            except EOFError:
+                return STATUS_ERROR, "worker exited without a result"
+            if kind != _TIMES:
+                return kind, payload
+            # Timed runs are done: the untimed checks get their own budget
+            job[4] = time.perf_counter() + check_timeout
+            job[5] = payload
+        return None, None
+
+    try:
+        while next_cell < len(pending) or running:
+            # Fill free worker slots
+            while next_cell < len(pending) and len(running) < workers:
+                cell = pending[next_cell]
+                next_cell += 1
+                sort_name, sort_func, pattern_name, n, arr, num_runs = cell
+                parent_conn, child_conn = ctx.Pipe(duplex=False)
+                proc = ctx.Process(target=_run_cell, args=(child_conn, sort_func, arr, num_runs, instrument, verify),
+                                   daemon=True)
+                proc.start()
+                child_conn.close()
+                started = time.perf_counter()
+                running.append([proc, parent_conn, cell, started, started + timeout, None])
+
+            # Reap finished or overdue cells
+            still_running = []
+            for job in running:
+                proc, conn, cell, started, _, _ = job
+                sort_name, _, pattern_name, n, _, _ = cell
+                status, payload = receive(job)
+                if status is None and not proc.is_alive():
+                    # Read again: the worker may have sent its result just before exiting
+                    status, payload = receive(job)
+                    if status is None:
+                        # Crashed without a result (e.g. C stack overflow)
+                        status, payload = STATUS_ERROR, f"exit code {proc.exitcode}"
+                times = job[5]
+                elapsed = time.perf_counter() - started
+
+                if status is not None:
+                    proc.join()
+                    conn.close()
+                    if status == STATUS_OK:
+                        record = _make_record(sort_name, pattern_name, n, status, times=times, counts=payload,
+                                              elapsed=elapsed)
+                    else:
+                        record = _make_record(sort_name, pattern_name, n, status, times=times, error=payload,
+                                              elapsed=elapsed)
+                    finish(cell, record)
+                elif time.perf_counter() > job[4]:
+                    proc.kill()
+                    proc.join()
+                    conn.close()
+                    if times is None:
+                        record = _make_record(sort_name, pattern_name, n, STATUS_TIMEOUT, elapsed=elapsed)
+                    else:
+                        record = _make_record(sort_name, pattern_name, n, STATUS_OK, times=times, elapsed=elapsed,
+                                              error=f"verification/instrumentation exceeded {check_timeout:g}s")
+                    finish(cell, record)
+                else:
+                    still_running.append(job)
+            running = still_running
+
+            if running:
+                time.sleep(0.005)
+
+        # Complete: the results live on in the returned records only
+        if checkpoint_path is not None and os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+    finally:
+        # Interrupted: make sure no orphaned workers keep running
+        for proc, conn, *_ in running:
+            proc.kill()
+            proc.join()
+            conn.close()
+
+    return results
@@ -1,33 +1,12 @@
-def binary_search(arr, key, left, right):
-    low = left
-    high = right
-    while low < high:
-        mid = low + (high - low) // 2  # Avoid potential overflow
-        if arr[mid] < key:
-            low = mid + 1
-        else:
-            high = mid
-    return low
-
-def binary_insertion_sort(arr, left=0, right=None):
-    if right is None:
-        right = len(arr) - 1
-
-    for i in range(left + 1, right + 1):
-        key = arr[i]
-        # Find the insertion point in arr[left:i]
-        pos = binary_search(arr, key, left, i)
-        # Shift elements from pos to i-1 one position to the right
-        arr[pos + 1:i + 1] = arr[pos:i]
-        # Insert the key at the correct position
-        arr[pos] = key
-    return arr
+from insertion_sort import binary_insertion_sort
+
 
 def merge(left, right):
     result = []
     i, j = 0, 0
     while i < len(left) and j < len(right):
-        if left[i] < right[j]:
+        # Take from the left run on ties to keep the sort stable
+        if left[i] <= right[j]:
             result.append(left[i])
             i += 1
         else:
@@ -60,4 +39,6 @@ def tim_sort(arr):
             arr[start:start + len(merged)] = merged  # Modify in place
 
         size *= 2
-    return arr
\ No newline at end of file
+    return arr
+
+tim_sort.stable = True
\ No newline at end of file
@@ -1,13 +1,15 @@
 from collections import deque
 import time
 
+from helpers.csr import CSRGraph
+
 
 def bfs(adj):
     """
     Breadth-First Search algorithm for a graph.
 
     Args:
-        adj: A graph represented as an adjacency list
+        adj: A graph represented as an adjacency list or a CSRGraph
 
     Returns:
         result: List of nodes in the order they were visited
@@ -57,11 +59,323 @@ def bfs_from_source(adj, start):
     return result, distances
 
 
-def measure_bfs_performance(adj, start_node=0):
-    """Measure BFS performance and collect metrics"""
+def reverse_adjacency(adj):
+    """In-neighbour lists of adj (a CSRGraph gives a transposed CSRGraph)"""
+    if isinstance(adj, CSRGraph):
+        return adj.transpose()
+    reverse = [[] for _ in range(len(adj))]
+    for u in range(len(adj)):
+        for v in adj[u]:
+            reverse[v].append(u)
+    return reverse
+
+
+# Beamer's switching thresholds: go bottom-up once the frontier's edges
+# exceed 1/ALPHA of the edges left to explore, and back to top-down once
+# a shrinking frontier holds fewer than 1/BETA of the nodes
+ALPHA = 14
+BETA = 24
+
+
+def bfs_direction_optimizing(adj, start, reverse_adj=None):
+    """
+    Direction-optimizing BFS from a specific source node.
+
+    Small frontiers are expanded top-down as in bfs_from_source. Once the
+    frontier is large, each unvisited node instead scans its in-neighbours
+    for one that is in the frontier (kept as a bytearray of flags) and stops
+    at the first hit. On dense, low-diameter graphs almost every node finds
+    a parent immediately, so the middle levels cost O(n) instead of
+    touching every edge.
+
+    Args:
+        adj: Adjacency list or CSRGraph
+        start: Source node
+        reverse_adj: In-neighbour lists of adj; may be adj itself for an
+            undirected graph, and is computed when omitted
+
+    Returns:
+        result: Nodes level by level (nodes within a level may be in a
+            different order than bfs_from_source gives)
+        distances: Same as bfs_from_source
+    """
+    n = len(adj)
+    if reverse_adj is None:
+        reverse_adj = reverse_adjacency(adj)
+    degrees = [len(adj[u]) for u in range(n)]
+
+    distances = [-1] * n
+    distances[start] = 0
+    result = [start]
+    frontier = [start]
+    unvisited = [v for v in range(n) if v != start]
+    # Edges out of nodes not yet expanded
+    edges_left = sum(degrees)
+    bottom_up = False
+    level = 0
+
+    while frontier:
+        frontier_edges = sum(degrees[u] for u in frontier)
+        if not bottom_up and frontier_edges > edges_left / ALPHA:
+            bottom_up = True
+        edges_left -= frontier_edges
+        level += 1
+        next_frontier = []
+
+        if bottom_up:
+            in_frontier = bytearray(n)
+            for u in frontier:
+                in_frontier[u] = 1
+            # unvisited may still hold nodes reached top-down since it was built
+            still_unvisited = []
+            for v in unvisited:
+                if distances[v] != -1:
+                    continue
+                for u in reverse_adj[v]:
+                    if in_frontier[u]:
+                        distances[v] = level
+                        next_frontier.append(v)
+                        break
+                else:
+                    still_unvisited.append(v)
+            unvisited = still_unvisited
+            if len(next_frontier) < len(frontier) and len(next_frontier) < n / BETA:
+                bottom_up = False
+        else:
+            for u in frontier:
+                for v in adj[u]:
+                    if distances[v] == -1:
+                        distances[v] = level
+                        next_frontier.append(v)
+
+        result.extend(next_frontier)
+        frontier = next_frontier
+
+    return result, distances
+
+
+def bfs_vectorized(graph, start):
+    """
+    Level-synchronous BFS from a specific source node with NumPy.
+
+    Each level is handled as a whole: the rows of all frontier nodes are
+    gathered from the CSR arrays in one fancy index, visited targets are
+    masked out, and the rest are deduplicated keeping each node's first
+    occurrence. That is the order in which the queue in bfs_from_source
+    discovers them, so both functions return identical results.
+
+    Args:
+        graph: CSRGraph (an adjacency list is converted first)
+        start: Source node
+
+    Returns:
+        result, distances: Same as bfs_from_source
+    """
+    import numpy as np
+
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_adjacency_list(graph)
+    offsets, targets, _ = graph.as_numpy()
+
+    distances = np.full(len(graph), -1, dtype=np.int64)
+    distances[start] = 0
+    frontier = np.array([start], dtype=np.int64)
+    levels = [frontier]
+    level = 0
+
+    while True:
+        starts = offsets[frontier]
+        counts = offsets[frontier + 1] - starts
+        total = int(counts.sum())
+        if total == 0:
+            break
+        # Edge positions of every frontier row, concatenated in frontier order
+        row_ends = np.cumsum(counts)
+        positions = np.arange(total) + np.repeat(starts - (row_ends - counts), counts)
+        neighbors = targets[positions]
+        neighbors = neighbors[distances[neighbors] == -1]
+        if len(neighbors) == 0:
+            break
+
+        _, first = np.unique(neighbors, return_index=True)
+        first.sort()
+        frontier = neighbors[first].astype(np.int64)
+        level += 1
+        distances[frontier] = level
+        levels.append(frontier)
+
+    return np.concatenate(levels).tolist(), distances.tolist()
+
+
+def bfs_multi_source(adj, sources):
+    """
+    BFS from several source nodes at once, sharing one frontier.
+
+    Every source starts at distance 0, so distances[v] is the hop count
+    from v to its nearest source.
+
+    Returns:
+        result: Nodes in the order they were visited
+        distances: List of distances to the nearest source (-1 if unreachable)
+    """
+    n = len(adj)
+    distances = [-1] * n
+    result = []
+
+    queue = deque()
+    for s in sources:
+        if distances[s] == -1:
+            distances[s] = 0
+            queue.append(s)
+
+    while queue:
+        vertex = queue.popleft()
+        result.append(vertex)
+
+        for neighbor in adj[vertex]:
+            if distances[neighbor] == -1:
+                distances[neighbor] = distances[vertex] + 1
+                queue.append(neighbor)
+
+    return result, distances
+
+
+# Sources handled by one bfs_batched call: one bit each in a 64-bit word
+BATCH_WIDTH = 64
+
+
+def bfs_batched(adj, sources, record_distances=True):
+    """
+    Multi-source BFS (MS-BFS): up to BATCH_WIDTH independent BFS runs in a
+    single traversal.
+
+    Every node holds a bitmask of the sources that have reached it. A level
+    ORs each frontier node's mask into its neighbours, so one edge scan
+    advances every BFS that crosses that edge instead of one per source.
+
+    Args:
+        adj: Adjacency list or CSRGraph
+        sources: Up to BATCH_WIDTH source nodes
+        record_distances: Fill the per-source distance lists; without them
+            only the eccentricities are computed
+
+    Returns:
+        distances: distances[i][v] is the hop count from sources[i] to v
+            (-1 if unreachable), or None if record_distances is False
+        eccentricities: Largest finite distance from each source
+    """
+    k = len(sources)
+    if k > BATCH_WIDTH:
+        raise ValueError(f"bfs_batched takes at most {BATCH_WIDTH} sources, got {k}")
+
+    n = len(adj)
+    seen = [0] * n
+    visit = [0] * n
+    visit_next = [0] * n
+    distances = [[-1] * n for _ in range(k)] if record_distances else None
+    eccentricities = [0] * k
+
+    frontier = []
+    for i, s in enumerate(sources):
+        if not visit[s]:
+            frontier.append(s)
+        seen[s] |= 1 << i
+        visit[s] |= 1 << i
+        if record_distances:
+            distances[i][s] = 0
+
+    level = 0
+    while frontier:
+        level += 1
+        touched = []
+        for vertex in frontier:
+            mask = visit[vertex]
+            visit[vertex] = 0
+            for neighbor in adj[vertex]:
+                new = mask & ~seen[neighbor]
+                if new:
+                    if not visit_next[neighbor]:
+                        touched.append(neighbor)
+                    visit_next[neighbor] |= new
+
+        frontier = []
+        reached = 0
+        for vertex in touched:
+            new = visit_next[vertex] & ~seen[vertex]
+            visit_next[vertex] = 0
+            seen[vertex] |= new
+            visit[vertex] = new
+            frontier.append(vertex)
+            reached |= new
+            if record_distances:
+                while new:
+                    bit = new & -new
+                    distances[bit.bit_length() - 1][vertex] = level
+                    new ^= bit
+
+        while reached:
+            bit = reached & -reached
+            eccentricities[bit.bit_length() - 1] = level
+            reached ^= bit
+
+    return distances, eccentricities
+
+
+def eccentricities(adj, sources=None):
+    """
+    Eccentricity of each source (all nodes by default), BATCH_WIDTH
+    sources per traversal. Unreachable nodes are ignored, as in
+    measure_bfs_performance's max_distance.
+    """
+    if sources is None:
+        sources = range(len(adj))
+    sources = list(sources)
+    result = []
+    for i in range(0, len(sources), BATCH_WIDTH):
+        result.extend(bfs_batched(adj, sources[i:i + BATCH_WIDTH], record_distances=False)[1])
+    return result
+
+
+def estimate_diameter(adj, sources=None):
+    """
+    Largest eccentricity among sources: the exact diameter (over reachable
+    pairs) when sources is None, a lower bound for a sample of nodes.
+    """
+    return max(eccentricities(adj, sources), default=0)
+
+
+def all_pairs_hop_distances(adj):
+    """Hop distance matrix as a list of rows, BATCH_WIDTH rows per traversal"""
+    n = len(adj)
+    rows = []
+    for i in range(0, n, BATCH_WIDTH):
+        rows.extend(bfs_batched(adj, range(i, min(i + BATCH_WIDTH, n)))[0])
+    return rows
+
+
+def measure_bfs_performance(adj, start_node=0, direction_optimizing=False, reverse_adj=None,
+                            vectorized=False):
+    """
+    Measure BFS performance and collect metrics
+
+    With direction_optimizing=True bfs_direction_optimizing is timed
+    instead; reverse_adj is then computed up front if not given. With
+    vectorized=True bfs_vectorized is timed, after converting an adjacency
+    list to a CSRGraph.
+    """
+    if direction_optimizing and reverse_adj is None:
+        reverse_adj = reverse_adjacency(adj)
+    if vectorized and not isinstance(adj, CSRGraph):
+        adj = CSRGraph.from_adjacency_list(adj)
+
     # Run BFS and time it
     start_time = time.time()
-    visited_nodes, distances = bfs_from_source(adj, start_node)
+    if direction_optimizing:
+        visited_nodes, distances = bfs_direction_optimizing(adj, start_node, reverse_adj)
+    elif vectorized:
+        visited_nodes, distances = bfs_vectorized(adj, start_node)
+    else:
+        visited_nodes, distances = bfs_from_source(adj, start_node)
     execution_time = time.time() - start_time
 
     # Calculate metrics
@@ -0,0 +1,164 @@
+from collections import deque
+
+
+def connected_components(adj):
+    """
+    Connected components by union-find over every edge, with path halving
+    and union by size, so no recursion and near-linear time. A directed
+    graph gives its weakly connected components.
+
+    Args:
+        adj: Adjacency list, list of {neighbor: weight} dictionaries or CSRGraph
+
+    Returns:
+        labels: labels[v] is v's component, numbered 0.. in order of each
+            component's smallest node
+        count: Number of components
+    """
+    n = len(adj)
+    parent = list(range(n))
+    size = [1] * n
+
+    for u in range(n):
+        for v in adj[u]:
+            # Find both roots, halving the paths on the way up
+            root_u = u
+            while parent[root_u] != root_u:
+                parent[root_u] = parent[parent[root_u]]
+                root_u = parent[root_u]
+            root_v = v
+            while parent[root_v] != root_v:
+                parent[root_v] = parent[parent[root_v]]
+                root_v = parent[root_v]
+            if root_u != root_v:
+                if size[root_u] < size[root_v]:
+                    root_u, root_v = root_v, root_u
+                parent[root_v] = root_u
+                size[root_u] += size[root_v]
+
+    labels = [-1] * n
+    root_label = {}
+    for v in range(n):
+        root = v
+        while parent[root] != root:
+            root = parent[root]
+        if root not in root_label:
+            root_label[root] = len(root_label)
+        labels[v] = root_label[root]
+    return labels, len(root_label)
+
+
+def component_sizes(labels, count):
+    """Number of nodes in each component"""
+    sizes = [0] * count
+    for label in labels:
+        sizes[label] += 1
+    return sizes
+
+
+def largest_component(labels, count):
+    """Nodes of the largest component in increasing order (ties go to the lowest label)"""
+    if not count:
+        return []
+    sizes = component_sizes(labels, count)
+    largest = max(range(count), key=sizes.__getitem__)
+    return [v for v, label in enumerate(labels) if label == largest]
+
+
+def strongly_connected_components(adj):
+    """
+    Tarjan's strongly connected components, iterative: each stack entry
+    holds a node and the iterator over its remaining neighbours, as in
+    dfs.dfs.
+
+    Args:
+        adj: Adjacency list or CSRGraph of a directed graph
+
+    Returns:
+        labels: labels[v] is v's component; components are numbered in
+            reverse topological order of the condensation, so every edge
+            u -> v has labels[u] >= labels[v]
+        count: Number of components
+    """
+    n = len(adj)
+    index = [-1] * n
+    low = [0] * n
+    on_stack = bytearray(n)
+    stack = []
+    labels = [-1] * n
+    count = 0
+    counter = 0
+
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        work = [(root, iter(adj[root]))]
+
+        while work:
+            node, neighbors = work[-1]
+            for neighbor in neighbors:
+                if index[neighbor] == -1:
+                    index[neighbor] = low[neighbor] = counter
+                    counter += 1
+                    stack.append(neighbor)
+                    on_stack[neighbor] = 1
+                    work.append((neighbor, iter(adj[neighbor])))
+                    break
+                if on_stack[neighbor] and index[neighbor] < low[node]:
+                    low[node] = index[neighbor]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+                if low[node] == index[node]:
+                    # node is the root of a component: pop it off the stack
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        labels[member] = count
+                        if member == node:
+                            break
+                    count += 1
+
+    return labels, count
+
+
+def topological_sort(adj):
+    """
+    Kahn's algorithm: repeatedly emit a node whose predecessors have all
+    been emitted.
+
+    Args:
+        adj: Adjacency list or CSRGraph of a directed graph
+
+    Returns:
+        order: Every node, each before all of its successors
+
+    Raises:
+        ValueError: If the graph has a cycle
+    """
+    n = len(adj)
+    in_degree = [0] * n
+    for u in range(n):
+        for v in adj[u]:
+            in_degree[v] += 1
+
+    queue = deque(v for v in range(n) if in_degree[v] == 0)
+    order = []
+    while queue:
+        u = queue.popleft()
+        order.append(u)
+        for v in adj[u]:
+            in_degree[v] -= 1
+            if in_degree[v] == 0:
+                queue.append(v)
+
+    if len(order) < n:
+        raise ValueError(f"graph has a cycle ({n - len(order)} nodes could not be ordered)")
+    return order
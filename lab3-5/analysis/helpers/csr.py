@@ -0,0 +1,181 @@
+from array import array
+
+
+class CSRGraph:
+    """
+    Graph in compressed sparse row form.
+
+    The neighbours of u are targets[offsets[u]:offsets[u + 1]] and, for a
+    weighted graph, their edge weights sit at the same positions in weights.
+    Edges take 12 bytes (an int32 target and a float64 weight) instead of a
+    Python int in a list or a dict entry, and each row is contiguous.
+
+    graph[u] returns a zero-copy memoryview of u's neighbours and len(graph)
+    is the node count, so code written for adjacency lists of lists can
+    traverse a CSRGraph unchanged.
+
+    CSR saves memory and makes graphs cheap to store, map and share between
+    processes; it is not the fast representation for the pure-Python
+    traversals. Slicing a memoryview per node and unpacking its int32
+    items costs more than iterating a list of ints, so bfs, dfs and
+    friends run up to 2-3x slower on a CSRGraph than on the same graph
+    from to_adjacency_list(). Convert before timing those, and use the
+    NumPy paths (bfs_vectorized, the vectorized builders) to get speed out
+    of the arrays themselves.
+    """
+
+    def __init__(self, offsets, targets, weights=None):
+        """
+        Args:
+            offsets: array('q') of length n + 1, non-decreasing, offsets[0] == 0
+            targets: array('i') of neighbour ids, grouped by source node
+            weights: Optional array('d') parallel to targets
+        """
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self._targets_view = memoryview(targets)
+        self._weights_view = memoryview(weights) if weights is not None else None
+
+    @classmethod
+    def from_adjacency_list(cls, adj):
+        """Build from a list of neighbour lists (as made by graph_builders)"""
+        offsets = array("q", [0])
+        targets = array("i")
+        for row in adj:
+            targets.extend(row)
+            offsets.append(len(targets))
+        return cls(offsets, targets)
+
+    @classmethod
+    def from_weighted_adjacency(cls, adj):
+        """Build from a list of {neighbour: weight} dictionaries"""
+        offsets = array("q", [0])
+        targets = array("i")
+        weights = array("d")
+        for row in adj:
+            targets.extend(row.keys())
+            weights.extend(row.values())
+            offsets.append(len(targets))
+        return cls(offsets, targets, weights)
+
+    @classmethod
+    def from_edges(cls, n, sources, targets, weights=None):
+        """
+        Build from parallel edge sequences with a counting sort by source.
+
+        Every (sources[k], targets[k]) pair becomes one directed edge, in
+        input order within each row; list both directions for an undirected
+        graph.
+        """
+        counts = [0] * (n + 1)
+        for u in sources:
+            counts[u + 1] += 1
+        for u in range(n):
+            counts[u + 1] += counts[u]
+        offsets = array("q", counts)
+
+        m = len(sources)
+        row_targets = array("i", bytes(4 * m))
+        row_weights = array("d", bytes(8 * m)) if weights is not None else None
+        fill = counts[:n]
+        for k in range(m):
+            u = sources[k]
+            pos = fill[u]
+            fill[u] = pos + 1
+            row_targets[pos] = targets[k]
+            if row_weights is not None:
+                row_weights[pos] = weights[k]
+        return cls(offsets, row_targets, row_weights)
+
+    @classmethod
+    def from_edge_arrays(cls, n, sources, targets, weights=None):
+        """
+        NumPy counterpart of from_edges for large edge arrays: one stable
+        argsort by source (skipped when sources is already sorted) and a
+        bincount for the offsets.
+        """
+        import numpy as np
+
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int32)
+        if len(sources) > 1 and np.any(sources[1:] < sources[:-1]):
+            order = np.argsort(sources, kind="stable")
+            targets = targets[order]
+            if weights is not None:
+                weights = np.asarray(weights)[order]
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=n), out=offsets[1:])
+
+        row_weights = None
+        if weights is not None:
+            row_weights = array("d", np.ascontiguousarray(weights, dtype=np.float64).tobytes())
+        return cls(array("q", offsets.tobytes()),
+                   array("i", np.ascontiguousarray(targets).tobytes()),
+                   row_weights)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, u):
+        return self._targets_view[self.offsets[u]:self.offsets[u + 1]]
+
+    @property
+    def num_edges(self):
+        return len(self.targets)
+
+    @property
+    def weighted(self):
+        return self.weights is not None
+
+    def degree(self, u):
+        return self.offsets[u + 1] - self.offsets[u]
+
+    def weighted_neighbors(self, u):
+        """(neighbour, weight) pairs of u, read straight from the arrays"""
+        start, end = self.offsets[u], self.offsets[u + 1]
+        return zip(self._targets_view[start:end], self._weights_view[start:end])
+
+    def nbytes(self):
+        """Bytes held by the backing arrays"""
+        total = self.offsets.itemsize * len(self.offsets) + self.targets.itemsize * len(self.targets)
+        if self.weights is not None:
+            total += self.weights.itemsize * len(self.weights)
+        return total
+
+    def to_adjacency_list(self):
+        return [list(self[u]) for u in range(len(self))]
+
+    def to_weighted_adjacency(self):
+        return [dict(self.weighted_neighbors(u)) for u in range(len(self))]
+
+    def transpose(self):
+        """Graph with every edge reversed (weights follow their edges)"""
+        import numpy as np
+
+        offsets, targets, weights = self.as_numpy()
+        sources = np.repeat(np.arange(len(self), dtype=np.int64), np.diff(offsets))
+        return CSRGraph.from_edge_arrays(len(self), targets, sources, weights)
+
+    def as_numpy(self):
+        """
+        Zero-copy NumPy views of (offsets, targets, weights); weights is None
+        for an unweighted graph.
+        """
+        import numpy as np
+
+        offsets = np.frombuffer(self.offsets, dtype=np.int64)
+        targets = np.frombuffer(self.targets, dtype=np.int32)
+        weights = np.frombuffer(self.weights, dtype=np.float64) if self.weights is not None else None
+        return offsets, targets, weights
+
+
+def weighted_rows(adj):
+    """
+    Function mapping u to its (neighbour, weight) pairs, for either a
+    CSRGraph or a list of {neighbour: weight} dictionaries. Algorithms look
+    it up once and call it in their inner loop.
+    """
+    if isinstance(adj, CSRGraph):
+        return adj.weighted_neighbors
+    return lambda u: adj[u].items()
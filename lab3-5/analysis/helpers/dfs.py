@@ -5,8 +5,12 @@ def dfs(adj):
     """
     Depth-First Search algorithm for a graph.
 
+    Iterative: each stack entry is the iterator over a node's remaining
+    neighbours, resumed where the recursive version would return to, so
+    the visit order is the same without any recursion limit.
+
     Args:
-        adj: A graph represented as an adjacency list
+        adj: A graph represented as an adjacency list or a CSRGraph
 
     Returns:
         result: List of nodes in the order they were visited
@@ -15,16 +19,20 @@ def dfs(adj):
     visited = [False] * n
     result = []
 
-    def dfs_visit(u):
-        visited[u] = True
-        result.append(u)
-        for neighbor in adj[u]:
-            if not visited[neighbor]:
-                dfs_visit(neighbor)
-
     for i in range(n):
         if not visited[i]:
-            dfs_visit(i)
+            visited[i] = True
+            result.append(i)
+            stack = [iter(adj[i])]
+            while stack:
+                for neighbor in stack[-1]:
+                    if not visited[neighbor]:
+                        visited[neighbor] = True
+                        result.append(neighbor)
+                        stack.append(iter(adj[neighbor]))
+                        break
+                else:
+                    stack.pop()
 
     return result
 
@@ -33,74 +41,153 @@ def dfs_from_source(adj, start):
     """DFS from a specific source node"""
     n = len(adj)
     visited = [False] * n
-    result = []
+    result = [start]
     depths = [0] * n
 
-    def dfs_visit(u, depth=0):
-        visited[u] = True
-        result.append(u)
-        depths[u] = depth
-
-        for neighbor in adj[u]:
+    visited[start] = True
+    stack = [iter(adj[start])]
+    while stack:
+        for neighbor in stack[-1]:
             if not visited[neighbor]:
-                dfs_visit(neighbor, depth + 1)
+                visited[neighbor] = True
+                result.append(neighbor)
+                # The stack holds one entry per node on the current path
+                depths[neighbor] = len(stack)
+                stack.append(iter(adj[neighbor]))
+                break
+        else:
+            stack.pop()
 
-    dfs_visit(start)
     return result, depths, visited
 
 
-def measure_dfs_performance(adj, start_node=0):
-    """Measure DFS performance and collect metrics"""
-    # Run DFS and time it
-    start_time = time.time()
-    visited_nodes, depths, visited = dfs_from_source(adj, start_node)
-    execution_time = time.time() - start_time
+def dfs_times(adj, start=None):
+    """
+    DFS recording pre-order and post-order times, depths and back edges.
 
-    # Calculate metrics
+    Starts from start only, or like dfs from every unvisited node in index
+    order when start is None. A back edge (u, v) leads to a node still on
+    the current path, which means the graph has a cycle (for an undirected
+    graph, every edge walked back to the parent counts).
+
+    Returns:
+        order: Nodes in visit order
+        pre: pre[u] is the time u was discovered, -1 if never
+        post: post[u] is the time u was finished, -1 if never
+        depths: Depth of each node in its DFS tree (0 if never visited)
+        back_edges: List of (u, v) back edges
+    """
     n = len(adj)
-    reachable_nodes = [i for i in range(n) if visited[i] and i != start_node]
+    order = []
+    pre = [-1] * n
+    post = [-1] * n
+    depths = [0] * n
+    on_path = bytearray(n)
+    back_edges = []
+    clock = 0
+
+    for root in (range(n) if start is None else (start,)):
+        if pre[root] != -1:
+            continue
+        pre[root] = clock
+        clock += 1
+        order.append(root)
+        on_path[root] = 1
+        path = [root]
+        stack = [iter(adj[root])]
+        while stack:
+            u = path[-1]
+            for v in stack[-1]:
+                if pre[v] == -1:
+                    pre[v] = clock
+                    clock += 1
+                    order.append(v)
+                    depths[v] = len(path)
+                    on_path[v] = 1
+                    path.append(v)
+                    stack.append(iter(adj[v]))
+                    break
+                if on_path[v]:
+                    back_edges.append((u, v))
+            else:
+                stack.pop()
+                path.pop()
+                on_path[u] = 0
+                post[u] = clock
+                clock += 1
+
+    return order, pre, post, depths, back_edges
+
+
+# Node colours for the fused traversal: unvisited, on the current path, finished
+WHITE, GREY, BLACK = 0, 1, 2
 
-    if not reachable_nodes:
-        avg_depth = 0
-        max_depth = 0
-    else:
-        avg_depth = sum(depths[i] for i in reachable_nodes) / len(reachable_nodes)
-        max_depth = max(depths[i] for i in reachable_nodes) if reachable_nodes else 0
 
-    coverage = len(visited_nodes) / n * 100
+def measure_dfs_performance(adj, start_node=0):
+    """
+    Measure DFS performance and collect metrics.
 
-    # Check for cycles (simplified approach)
+    One colour-marking traversal does all the work: it starts at start_node
+    (the timed part, which yields the order, depths and reachability) and
+    then carries on from every node still white, counting DFS trees
+    (connected components of an undirected graph) and watching for an edge
+    to a grey node, i.e. a cycle.
+    """
+    n = len(adj)
+    colour = bytearray(n)
+    visited_nodes = []
+    depths = [0] * n
+    depth_sum = 0
+    max_depth = 0
     has_cycle = False
-    cycle_visited = [False] * n
-    rec_stack = [False] * n
+    component_count = 0
+    execution_time = 0
 
-    def check_cycle(u):
-        cycle_visited[u] = True
-        rec_stack[u] = True
-
-        for neighbor in adj[u]:
-            if not cycle_visited[neighbor]:
-                if check_cycle(neighbor):
-                    return True
-            elif rec_stack[neighbor]:
-                return True
-
-        rec_stack[u] = False
-        return False
-
-    for i in range(n):
-        if not cycle_visited[i]:
-            if check_cycle(i):
-                has_cycle = True
-                break
+    start_time = time.time()
+    for root in (start_node, *range(n)):
+        if colour[root] != WHITE:
+            continue
+        component_count += 1
+        from_start = root == start_node
+        colour[root] = GREY
+        if from_start:
+            visited_nodes.append(root)
+        path = [root]
+        stack = [iter(adj[root])]
+        while stack:
+            for neighbor in stack[-1]:
+                c = colour[neighbor]
+                if c == WHITE:
+                    colour[neighbor] = GREY
+                    if from_start:
+                        visited_nodes.append(neighbor)
+                        depth = len(stack)
+                        depths[neighbor] = depth
+                        depth_sum += depth
+                        if depth > max_depth:
+                            max_depth = depth
+                    path.append(neighbor)
+                    stack.append(iter(adj[neighbor]))
+                    break
+                if c == GREY:
+                    has_cycle = True
+            else:
+                stack.pop()
+                colour[path.pop()] = BLACK
+        if from_start:
+            execution_time = time.time() - start_time
+
+    reachable_count = len(visited_nodes)
+    avg_depth = depth_sum / (reachable_count - 1) if reachable_count > 1 else 0
 
     return {
         "visited_nodes": visited_nodes,
         "depths": depths,
         "avg_depth": avg_depth,
         "max_depth": max_depth,
-        "coverage": coverage,
-        "reachable_count": len(reachable_nodes) + 1,
+        "coverage": reachable_count / n * 100,
+        "reachable_count": reachable_count,
         "has_cycle": has_cycle,
+        "component_count": component_count,
         "execution_time": execution_time * 1000  # Convert to milliseconds
-    }
\ No newline at end of file
+    }
@@ -1,21 +1,62 @@
 import time
 import heapq
 
+from helpers.csr import weighted_rows
+from helpers.heaps import IndexedDaryHeap
 
-def dijkstra(adj, start_node):
+
+def dijkstra(adj, start_node, heap="indexed"):
     """
     Dijkstra's algorithm for shortest path from a single source.
-    Works on weighted graphs represented as adjacency lists of {neighbor: weight} dictionaries.
+    Works on weighted graphs represented as adjacency lists of {neighbor: weight} dictionaries
+    or as a weighted CSRGraph.
 
     Args:
-        adj: List of dictionaries where adj[i] = {j: weight} for edge (i,j)
+        adj: List of dictionaries where adj[i] = {j: weight} for edge (i,j), or a CSRGraph
         start_node: Source node to find shortest paths from
+        heap: "indexed" for an IndexedDaryHeap with decrease-key (at most one
+            entry per node), "heapq" for heapq with lazy deletion
 
     Returns:
         distances: List of shortest distances from start_node to all other nodes
         predecessors: List of predecessors for reconstructing paths
     """
+    if heap == "heapq":
+        return _dijkstra_heapq(adj, start_node)
+    if heap != "indexed":
+        raise ValueError(f"unknown heap {heap!r}")
+
+    n = len(adj)
+    row = weighted_rows(adj)
+    distances = [float('inf')] * n
+    distances[start_node] = 0
+    predecessors = [None] * n
+    done = [False] * n
+
+    pq = IndexedDaryHeap(n)
+    pq.push(start_node, 0)
+
+    while pq:
+        dist, node = pq.pop()
+        done[node] = True
+
+        for neighbor, weight in row(node):
+            if not done[neighbor]:
+                new_dist = dist + weight
+
+                # Found a better path: insert or decrease in place
+                if new_dist < distances[neighbor]:
+                    distances[neighbor] = new_dist
+                    predecessors[neighbor] = node
+                    pq.push_or_decrease(neighbor, new_dist)
+
+    return distances, predecessors
+
+
+def _dijkstra_heapq(adj, start_node):
+    """dijkstra with heapq and lazy deletion: one entry per relaxation"""
     n = len(adj)
+    row = weighted_rows(adj)
     distances = [float('inf')] * n
     distances[start_node] = 0
     predecessors = [None] * n
@@ -36,7 +77,7 @@ def dijkstra(adj, start_node):
         visited.add(node)
 
         # Check neighbors
-        for neighbor, weight in adj[node].items():
+        for neighbor, weight in row(node):
             if neighbor not in visited:
                 new_dist = dist + weight
 
@@ -49,13 +90,14 @@ def dijkstra(adj, start_node):
     return distances, predecessors
 
 
-def measure_dijkstra_performance(adj, start_node=0):
+def measure_dijkstra_performance(adj, start_node=0, heap="indexed"):
     """
     Measure Dijkstra's algorithm performance and collect metrics
 
     Args:
         adj: Graph represented as adjacency list of dictionaries
         start_node: Starting node
+        heap: Priority queue to use, see dijkstra
 
     Returns:
         metrics: Dictionary of performance metrics
@@ -64,7 +106,7 @@ def measure_dijkstra_performance(adj, start_node=0):
     start_time = time.time()
 
     # Run Dijkstra's algorithm
-    distances, predecessors = dijkstra(adj, start_node)
+    distances, predecessors = dijkstra(adj, start_node, heap)
 
     # End timing
     execution_time = time.time() - start_time
@@ -1,19 +1,23 @@
 import time
 
+from helpers.csr import weighted_rows
+
 
 def floyd_warshall(adj):
     """
     Floyd-Warshall algorithm for all-pairs shortest paths.
-    Works on weighted graphs represented as adjacency lists of {neighbor: weight} dictionaries.
+    Works on weighted graphs represented as adjacency lists of {neighbor: weight} dictionaries
+    or as a weighted CSRGraph.
 
     Args:
-        adj: List of dictionaries where adj[i] = {j: weight} for edge (i,j)
+        adj: List of dictionaries where adj[i] = {j: weight} for edge (i,j), or a CSRGraph
 
     Returns:
         dist: 2D list where dist[i][j] is the shortest distance from node i to j
         next: 2D list for path reconstruction where next[i][j] is the next node on shortest path from i to j
     """
     n = len(adj)
+    row = weighted_rows(adj)
 
     # Initialize distance matrix
     dist = [[float('inf')] * n for _ in range(n)]
@@ -25,7 +29,7 @@ def floyd_warshall(adj):
 
     # Initialize with direct edge weights
     for i in range(n):
-        for j, weight in adj[i].items():
+        for j, weight in row(i):
             dist[i][j] = weight
             next[i][j] = j
 
@@ -0,0 +1,148 @@
+import mmap
+import os
+import struct
+import zlib
+
+import numpy as np
+
+from helpers.csr import CSRGraph
+from helpers.vectorized_builders import (
+    add_random_weights,
+    generate_complete_graph_csr,
+    generate_dense_graph_csr,
+    generate_sparse_graph_csr,
+    generate_tree_graph_csr,
+    generate_connected_graph_csr,
+    generate_disconnected_graph_csr,
+    generate_cyclic_graph_csr,
+    generate_acyclic_graph_csr,
+    generate_grid_graph_csr
+)
+
+# Graph types shared by the lab3, lab4 and lab5 benchmarks
+GRAPH_TYPES = {
+    "Complete Graph": generate_complete_graph_csr,
+    "Dense Graph": generate_dense_graph_csr,
+    "Sparse Graph": generate_sparse_graph_csr,
+    "Tree Graph": generate_tree_graph_csr,
+    "Connected Graph": generate_connected_graph_csr,
+    "Disconnected Graph": generate_disconnected_graph_csr,
+    "Cyclic Graph": generate_cyclic_graph_csr,
+    "Acyclic Graph": generate_acyclic_graph_csr,
+    "Grid Graph": generate_grid_graph_csr
+}
+
+CORPUS_DIR = "graph_corpus"
+CORPUS_SEED = 2025
+
+# Weighting variants: None keeps the graph unweighted, "directed" gives
+# every directed edge its own weight (lab4), "symmetric" adds the reverse
+# of every edge and gives both directions one weight (lab5's MSTs)
+WEIGHTINGS = (None, "directed", "symmetric")
+
+# File layout: magic, weighted flag, padding, node count, edge count, then
+# int64 offsets, int32 targets (padded to 8 bytes) and float64 weights
+_MAGIC = b"GCR1"
+_HEADER = struct.Struct("<4sB3xQQ")
+
+
+def graph_rng(graph_type, n, seed, weighting=None):
+    """
+    NumPy generator dedicated to one corpus graph. Seeded from the
+    (type, n, seed, weighting) key alone, so every graph is the same across
+    runs and labs whichever other graphs were generated first.
+    """
+    salt = WEIGHTINGS.index(weighting)
+    return np.random.default_rng([zlib.crc32(graph_type.encode()), n, seed, salt])
+
+
+def graph_path(cache_dir, graph_type, n, seed, weighting=None):
+    """Cache file path for a corpus graph"""
+    safe_name = graph_type.replace(' ', '_').lower()
+    suffix = f"_{weighting}" if weighting else ""
+    return os.path.join(cache_dir, f"{safe_name}_n{n}_s{seed}{suffix}.gcr")
+
+
+def _targets_size(m):
+    return (4 * m + 7) // 8 * 8
+
+
+def save_graph(path, graph):
+    """
+    Write a CSRGraph in the corpus binary format, via a temporary file so an
+    interrupted run never leaves a truncated graph behind.
+    """
+    n, m = len(graph), graph.num_edges
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, graph.weighted, n, m))
+        f.write(memoryview(graph.offsets).cast("B"))
+        f.write(memoryview(graph.targets).cast("B"))
+        f.write(bytes(_targets_size(m) - 4 * m))
+        if graph.weighted:
+            f.write(memoryview(graph.weights).cast("B"))
+    os.replace(tmp_path, path)
+
+
+def load_graph(path):
+    """
+    Memory-map a corpus file as a CSRGraph. The graph's arrays are views of
+    the mapping, so nothing is read until it is traversed.
+
+    Returns:
+        graph: CSRGraph, or None if the file is missing or invalid
+    """
+    if not os.path.exists(path):
+        return None
+
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < _HEADER.size:
+            return None
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, weighted, n, m = _HEADER.unpack_from(mm, 0)
+    targets_start = _HEADER.size + 8 * (n + 1)
+    weights_start = targets_start + _targets_size(m)
+    expected = weights_start + (8 * m if weighted else 0)
+    if magic != _MAGIC or size != expected:
+        mm.close()
+        return None
+
+    view = memoryview(mm)
+    offsets = view[_HEADER.size:targets_start].cast("q")
+    targets = view[targets_start:targets_start + 4 * m].cast("i")
+    weights = view[weights_start:expected].cast("d") if weighted else None
+    return CSRGraph(offsets, targets, weights)
+
+
+def get_graph(graph_type, n, seed=CORPUS_SEED, weighting=None, cache_dir=CORPUS_DIR):
+    """
+    Corpus graph for a (type, n, seed) key, generated on first use and
+    memory-mapped from the cache afterwards.
+
+    Args:
+        graph_type: One of GRAPH_TYPES
+        n: Number of nodes
+        seed: Corpus seed (part of the cache key)
+        weighting: One of WEIGHTINGS
+        cache_dir: Directory holding the cached graphs
+
+    Returns:
+        graph: Read-only CSRGraph
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    path = graph_path(cache_dir, graph_type, n, seed, weighting)
+
+    graph = load_graph(path)
+    if graph is None:
+        if weighting is None:
+            graph = GRAPH_TYPES[graph_type](n, rng=graph_rng(graph_type, n, seed))
+        else:
+            # Weighted variants share the unweighted topology
+            graph = add_random_weights(get_graph(graph_type, n, seed, None, cache_dir),
+                                       rng=graph_rng(graph_type, n, seed, weighting),
+                                       symmetric=weighting == "symmetric")
+        save_graph(path, graph)
+        graph = load_graph(path)
+    return graph
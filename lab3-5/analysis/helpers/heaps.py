@@ -0,0 +1,106 @@
+class IndexedDaryHeap:
+    """
+    Array-backed d-ary min-heap over the nodes 0..n-1 with decrease-key.
+
+    pos[node] is the node's slot in heap (-1 when absent), so a node's key
+    can be lowered in place instead of pushing a second entry the way lazy
+    deletion with heapq does. The heap never holds more than n entries.
+    A wide node (d = 8 by default) makes the tree shallow, which favours
+    the many decrease-keys of graph algorithms; pops pay for it by scanning
+    d children, but with one C-level min over a slice of keys.
+    """
+
+    def __init__(self, n, d=8):
+        self.d = d
+        self.heap = []
+        # Keys by heap slot rather than by node, so a sift compares
+        # neighbouring list items and the d children of a slot are one slice
+        self.heap_keys = []
+        self.pos = [-1] * n
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, node):
+        return self.pos[node] >= 0
+
+    def key(self, node):
+        """Key of a node in the heap"""
+        return self.heap_keys[self.pos[node]]
+
+    def push(self, node, key):
+        """Insert a node that is not in the heap"""
+        self.heap.append(node)
+        self.heap_keys.append(key)
+        self._sift_up(len(self.heap) - 1, node, key)
+
+    def decrease_key(self, node, key):
+        """Lower the key of a node in the heap"""
+        self._sift_up(self.pos[node], node, key)
+
+    def push_or_decrease(self, node, key):
+        """
+        Insert node, or lower its key if key is smaller than the current one.
+
+        Returns:
+            True if the heap changed
+        """
+        i = self.pos[node]
+        if i < 0:
+            self.push(node, key)
+            return True
+        if key < self.heap_keys[i]:
+            self._sift_up(i, node, key)
+            return True
+        return False
+
+    def pop(self):
+        """Remove the node with the smallest key and return (key, node)"""
+        heap, heap_keys = self.heap, self.heap_keys
+        node, key = heap[0], heap_keys[0]
+        last, last_key = heap.pop(), heap_keys.pop()
+        self.pos[node] = -1
+        if heap:
+            self._sift_down(last, last_key)
+        return key, node
+
+    def _sift_up(self, i, node, key):
+        """Move node, with its new key, up from slot i to where it belongs"""
+        heap, heap_keys, pos, d = self.heap, self.heap_keys, self.pos, self.d
+        while i > 0:
+            parent = (i - 1) // d
+            parent_key = heap_keys[parent]
+            if parent_key <= key:
+                break
+            parent_node = heap[parent]
+            heap[i] = parent_node
+            heap_keys[i] = parent_key
+            pos[parent_node] = i
+            i = parent
+        heap[i] = node
+        heap_keys[i] = key
+        pos[node] = i
+
+    def _sift_down(self, node, key):
+        """Place node, with key, at the root slot and move it down"""
+        heap, heap_keys, pos, d = self.heap, self.heap_keys, self.pos, self.d
+        size = len(heap)
+        i = 0
+        while True:
+            first = d * i + 1
+            if first >= size:
+                break
+            # Smallest of up to d children, found by min and index in C
+            end = first + d
+            child_key = min(heap_keys[first:end])
+            if child_key >= key:
+                break
+            child = heap_keys.index(child_key, first, end)
+            child_node = heap[child]
+            heap[i] = child_node
+            heap_keys[i] = child_key
+            pos[child_node] = i
+            i = child
+        heap[i] = node
+        heap_keys[i] = key
+        pos[node] = i
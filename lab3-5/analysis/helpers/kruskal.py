@@ -1,5 +1,7 @@
 import time
 
+from helpers.csr import weighted_rows
+
 
 class DisjointSet:
     """Disjoint Set data structure for efficient Union-Find operations"""
@@ -40,18 +42,19 @@ def kruskal(adj):
     Kruskal's algorithm for finding Minimum Spanning Tree
 
     Args:
-        adj: Weighted graph as adjacency list of {neighbor: weight} dictionaries
+        adj: Weighted graph as adjacency list of {neighbor: weight} dictionaries, or a CSRGraph
 
     Returns:
         mst_edges: List of (u, v, weight) tuples in the MST
         total_weight: Total weight of the MST
     """
     n = len(adj)
+    row = weighted_rows(adj)
     edges = []
 
     # Extract all edges from adjacency list
     for u in range(n):
-        for v, weight in adj[u].items():
+        for v, weight in row(u):
             if u < v:  # Add each edge only once
                 edges.append((u, v, weight))
 
@@ -105,21 +108,16 @@ def measure_kruskal_performance(adj):
         vertices_in_mst.add(u)
         vertices_in_mst.add(v)
 
-    # Check components through Union-Find
-    ds = DisjointSet(n)
-    for u, v, _ in mst_edges:
-        ds.union(u, v)
-
-    components = set()
-    for i in range(n):
-        components.add(ds.find(i))
+    # The MST is a spanning forest, and every edge of a forest joins two
+    # of its components
+    component_count = n - len(mst_edges)
 
     return {
         "mst_edges": mst_edges,
         "total_weight": total_weight,
         "execution_time": execution_time * 1000,  # Convert to milliseconds
         "vertices_covered": len(vertices_in_mst),
-        "component_count": len(components)
+        "component_count": component_count
     }
 
 
@@ -0,0 +1,178 @@
+import os
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from helpers.bfs import bfs_from_source
+from helpers.csr import CSRGraph
+from helpers.dijkstra import dijkstra
+
+# Process-parallel all-sources traversals. The graph's CSR arrays are
+# copied into one shared memory block before the pool starts, and every
+# worker maps that block as a CSRGraph once, in its initializer. Tasks
+# only carry a block of source nodes, and workers write distance rows
+# straight into a shared result matrix, so neither the graph nor the
+# results are pickled.
+
+
+def _layout(n, m, weighted):
+    """Byte offsets of (targets, weights, end) in a shared graph block"""
+    targets_start = 8 * (n + 1)
+    weights_start = targets_start + (4 * m + 7) // 8 * 8
+    return targets_start, weights_start, weights_start + (8 * m if weighted else 0)
+
+
+def share_graph(graph):
+    """
+    Copy a CSRGraph into a new shared memory block.
+
+    Returns:
+        shm: SharedMemory holding the arrays; the caller unlinks it
+        spec: Picklable (name, n, m, weighted) for attach_graph
+    """
+    n, m = len(graph), graph.num_edges
+    targets_start, weights_start, end = _layout(n, m, graph.weighted)
+    shm = SharedMemory(create=True, size=max(end, 1))
+    shm.buf[:targets_start] = memoryview(graph.offsets).cast("B")
+    shm.buf[targets_start:targets_start + 4 * m] = memoryview(graph.targets).cast("B")
+    if graph.weighted:
+        shm.buf[weights_start:end] = memoryview(graph.weights).cast("B")
+    return shm, (shm.name, n, m, graph.weighted)
+
+
+def attach_graph(spec):
+    """
+    Map a block made by share_graph as a read-only CSRGraph.
+
+    Returns:
+        shm: The attached SharedMemory; keep it open while the graph is used
+        graph: CSRGraph whose arrays are views of the block
+    """
+    name, n, m, weighted = spec
+    shm = SharedMemory(name=name)
+    targets_start, weights_start, end = _layout(n, m, weighted)
+    view = shm.buf.toreadonly()
+    offsets = view[:targets_start].cast("q")
+    targets = view[targets_start:targets_start + 4 * m].cast("i")
+    weights = view[weights_start:end].cast("d") if weighted else None
+    return shm, CSRGraph(offsets, targets, weights)
+
+
+# Per-worker state, set up once by _init_worker
+_worker = {}
+
+
+def _init_worker(graph_spec, out_name, out_shape, out_dtype):
+    graph_shm, graph = attach_graph(graph_spec)
+    out_shm = SharedMemory(name=out_name)
+    _worker["graph_shm"] = graph_shm
+    _worker["graph"] = graph
+    _worker["out_shm"] = out_shm
+    _worker["out"] = np.ndarray(out_shape, dtype=out_dtype, buffer=out_shm.buf)
+
+
+def _run_block(task):
+    """Fill rows first_row.. of the result matrix, one per source"""
+    kind, first_row, sources = task
+    graph, out = _worker["graph"], _worker["out"]
+    for row, source in enumerate(sources, first_row):
+        if kind == "bfs":
+            out[row] = bfs_from_source(graph, source)[1]
+        else:
+            out[row] = dijkstra(graph, source)[0]
+
+
+class AllSourcesExecutor:
+    """
+    Runs bfs_from_source or dijkstra from many sources on a pool of worker
+    processes sharing one copy of the graph.
+
+    Use as a context manager, or call close() to release the shared memory:
+
+        with AllSourcesExecutor(graph) as executor:
+            hops = executor.bfs()
+    """
+
+    def __init__(self, graph, processes=None):
+        """
+        Args:
+            graph: CSRGraph (weighted for dijkstra), or an adjacency list
+                of lists or of {neighbour: weight} dictionaries
+            processes: Worker count, os.cpu_count() by default
+        """
+        if not isinstance(graph, CSRGraph):
+            if len(graph) and isinstance(graph[0], dict):
+                graph = CSRGraph.from_weighted_adjacency(graph)
+            else:
+                graph = CSRGraph.from_adjacency_list(graph)
+        self.n = len(graph)
+        self.weighted = graph.weighted
+        self.processes = processes or os.cpu_count() or 1
+        self._graph_shm, self._graph_spec = share_graph(graph)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._graph_shm is not None:
+            self._graph_shm.close()
+            self._graph_shm.unlink()
+            self._graph_shm = None
+
+    def bfs(self, sources=None, chunk_size=None):
+        """
+        Hop distances from every source.
+
+        Returns:
+            distances: int32 array of shape (len(sources), n), -1 where unreachable
+        """
+        return self._run("bfs", np.int32, sources, chunk_size)
+
+    def dijkstra(self, sources=None, chunk_size=None):
+        """
+        Shortest path distances from every source.
+
+        Returns:
+            distances: float64 array of shape (len(sources), n), inf where unreachable
+        """
+        if not self.weighted:
+            raise ValueError("dijkstra needs a weighted graph")
+        return self._run("dijkstra", np.float64, sources, chunk_size)
+
+    def _run(self, kind, dtype, sources, chunk_size):
+        sources = list(range(self.n) if sources is None else sources)
+        shape = (len(sources), self.n)
+        if not sources:
+            return np.empty(shape, dtype=dtype)
+        # About four blocks per worker balances uneven sources without
+        # paying for many small tasks
+        if chunk_size is None:
+            chunk_size = max(1, -(-len(sources) // (4 * self.processes)))
+        tasks = [(kind, i, sources[i:i + chunk_size]) for i in range(0, len(sources), chunk_size)]
+
+        out_shm = SharedMemory(create=True, size=max(int(np.prod(shape)) * np.dtype(dtype).itemsize, 1))
+        try:
+            with Pool(min(self.processes, len(tasks)), initializer=_init_worker,
+                      initargs=(self._graph_spec, out_shm.name, shape, dtype)) as pool:
+                for _ in pool.imap_unordered(_run_block, tasks):
+                    pass
+            return np.ndarray(shape, dtype=dtype, buffer=out_shm.buf).copy()
+        finally:
+            out_shm.close()
+            out_shm.unlink()
+
+
+def all_sources_bfs(graph, sources=None, processes=None):
+    """Hop distance matrix from every source, see AllSourcesExecutor.bfs"""
+    with AllSourcesExecutor(graph, processes) as executor:
+        return executor.bfs(sources)
+
+
+def all_sources_dijkstra(graph, sources=None, processes=None):
+    """Shortest path distance matrix from every source, see AllSourcesExecutor.dijkstra"""
+    with AllSourcesExecutor(graph, processes) as executor:
+        return executor.dijkstra(sources)
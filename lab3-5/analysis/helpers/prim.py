@@ -1,20 +1,64 @@
 import time
 import heapq
 
+from helpers.components import connected_components, largest_component
+from helpers.csr import weighted_rows
+from helpers.heaps import IndexedDaryHeap
 
-def prim(adj, start_node=0):
+
+def prim(adj, start_node=0, heap="indexed"):
     """
     Prim's algorithm for finding Minimum Spanning Tree
 
     Args:
-        adj: Weighted graph as adjacency list of {neighbor: weight} dictionaries
+        adj: Weighted graph as adjacency list of {neighbor: weight} dictionaries, or a CSRGraph
         start_node: Starting vertex
+        heap: "indexed" keeps one entry per vertex outside the tree, keyed by
+            its cheapest edge to the tree, in an IndexedDaryHeap;
+            "heapq" pushes every edge with lazy deletion
 
     Returns:
         mst_edges: List of (u, v, weight) tuples in the MST
         total_weight: Total weight of the MST
     """
+    if heap == "heapq":
+        return _prim_heapq(adj, start_node)
+    if heap != "indexed":
+        raise ValueError(f"unknown heap {heap!r}")
+
+    n = len(adj)
+    row = weighted_rows(adj)
+    visited = [False] * n
+    parent = [None] * n
+    mst_edges = []
+    total_weight = 0
+
+    pq = IndexedDaryHeap(n)
+    visited[start_node] = True
+    for neighbor, weight in row(start_node):
+        if not visited[neighbor] and pq.push_or_decrease(neighbor, weight):
+            parent[neighbor] = start_node
+
+    while pq:
+        weight, to_vertex = pq.pop()
+
+        # Add the edge to MST
+        visited[to_vertex] = True
+        mst_edges.append((parent[to_vertex], to_vertex, weight))
+        total_weight += weight
+
+        # A cheaper edge from the tree to a neighbour replaces its key
+        for neighbor, edge_weight in row(to_vertex):
+            if not visited[neighbor] and pq.push_or_decrease(neighbor, edge_weight):
+                parent[neighbor] = to_vertex
+
+    return mst_edges, total_weight
+
+
+def _prim_heapq(adj, start_node):
+    """prim with heapq and lazy deletion: one (weight, to, from) entry per edge"""
     n = len(adj)
+    row = weighted_rows(adj)
     visited = [False] * n
     mst_edges = []
     total_weight = 0
@@ -26,7 +70,7 @@ def prim(adj, start_node=0):
     visited[start_node] = True
 
     # Add all edges from start_node to the priority queue
-    for neighbor, weight in adj[start_node].items():
+    for neighbor, weight in row(start_node):
         heapq.heappush(pq, (weight, neighbor, start_node))
 
     # While there are edges to process
@@ -43,7 +87,7 @@ def prim(adj, start_node=0):
         total_weight += weight
 
         # Add all edges from the newly visited vertex
-        for neighbor, edge_weight in adj[to_vertex].items():
+        for neighbor, edge_weight in row(to_vertex):
             if not visited[neighbor]:
                 heapq.heappush(pq, (edge_weight, neighbor, to_vertex))
 
@@ -51,40 +95,18 @@ def prim(adj, start_node=0):
 
 
 def find_largest_component(adj):
-    """Find the largest connected component in a graph"""
-    n = len(adj)
-    visited = [False] * n
-    components = []
-
-    for i in range(n):
-        if not visited[i]:
-            # Find all nodes in this component
-            component = []
-            queue = [i]
-            visited[i] = True
-
-            while queue:
-                node = queue.pop(0)
-                component.append(node)
-
-                for neighbor in adj[node]:
-                    if not visited[neighbor]:
-                        visited[neighbor] = True
-                        queue.append(neighbor)
-
-            components.append(component)
-
-    # Return the largest component
-    return max(components, key=len) if components else []
+    """Find the largest connected component in a graph (its nodes in increasing order)"""
+    return largest_component(*connected_components(adj))
 
 
-def measure_prim_performance(adj, start_node=0):
+def measure_prim_performance(adj, start_node=0, heap="indexed"):
     """
     Measure Prim's algorithm performance
 
     Args:
         adj: Weighted adjacency list
         start_node: Starting vertex
+        heap: Priority queue to use, see prim
 
     Returns:
         Dictionary of performance metrics
@@ -99,7 +121,7 @@ def measure_prim_performance(adj, start_node=0):
             start_node = component[0]  # Use first node in largest component
 
     # Run Prim's algorithm
-    mst_edges, total_weight = prim(adj, start_node)
+    mst_edges, total_weight = prim(adj, start_node, heap)
 
     # End timing
     execution_time = time.time() - start_time
@@ -125,7 +147,7 @@ def measure_prim_performance(adj, start_node=0):
     }
 
 
-def test_prim(adj, start_node=0):
+def test_prim(adj, start_node=0, heap="indexed"):
     """Test function that matches the style in minimum_spanning_tree.py"""
     # Handle disconnected graphs by finding the largest component
     if not any(adj[start_node]):  # If start_node has no neighbors
@@ -134,5 +156,5 @@ def test_prim(adj, start_node=0):
             start_node = component[0]  # Use first node in largest component
 
     start = time.time()
-    _, total_weight = prim(adj, start_node)
+    _, total_weight = prim(adj, start_node, heap)
     return time.time() - start
\ No newline at end of file
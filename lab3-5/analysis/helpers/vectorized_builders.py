@@ -0,0 +1,228 @@
+import math
+
+import numpy as np
+
+from helpers.csr import CSRGraph
+
+# NumPy versions of the generators in graph_builders. Each graph type draws
+# from the same distribution as its counterpart there, but edges are made
+# as whole arrays and go straight into a CSRGraph, so graphs with millions
+# of nodes build in seconds. Every function takes rng as a seed or a
+# numpy Generator; None draws fresh entropy.
+
+
+def _bernoulli_positions(total, p, rng):
+    """
+    Sorted positions in [0, total), each present independently with
+    probability p. Rather than drawing one number per position, the gaps
+    between kept positions are drawn from a geometric distribution, so the
+    cost is proportional to the number of positions kept.
+    """
+    if total <= 0 or p <= 0:
+        return np.empty(0, dtype=np.int64)
+    if p >= 1:
+        return np.arange(total, dtype=np.int64)
+    if p > 0.5:
+        # Dense: skip over the positions left out instead
+        mask = np.ones(total, dtype=bool)
+        mask[_bernoulli_positions(total, 1 - p, rng)] = False
+        return np.flatnonzero(mask)
+
+    chunks = []
+    last = -1
+    # Enough gaps to pass the end in one draw almost always
+    batch = int(total * p + 4 * math.sqrt(total * p)) + 16
+    while last < total:
+        positions = last + np.cumsum(rng.geometric(p, size=batch))
+        chunks.append(positions)
+        last = int(positions[-1])
+        batch = int((total - last) * p * 1.1) + 16
+    positions = np.concatenate(chunks)
+    return positions[positions < total]
+
+
+def erdos_renyi_edges(n, p, rng=None, directed=True):
+    """
+    Edges of a G(n, p) random graph without self-loops.
+
+    Directed graphs consider every ordered pair, undirected ones every pair
+    i < j once and return both directions.
+
+    Returns:
+        sources, targets: int64 arrays, sorted by source when directed
+    """
+    rng = np.random.default_rng(rng)
+    if n < 2:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    if directed:
+        # Pair index k maps to row k // (n - 1); the column skips the diagonal
+        k = _bernoulli_positions(n * (n - 1), p, rng)
+        sources = k // (n - 1)
+        r = k - sources * (n - 1)
+        return sources, r + (r >= sources)
+
+    sources, targets = upper_triangle_edges(n, p, rng)
+    return np.concatenate([sources, targets]), np.concatenate([targets, sources])
+
+
+def upper_triangle_edges(n, p, rng=None):
+    """Pairs i < j, each present with probability p (a random DAG in topological order)"""
+    rng = np.random.default_rng(rng)
+    if n < 2:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    # Row i holds the n - 1 - i pairs (i, i+1) .. (i, n-1)
+    rows = np.arange(n - 1, dtype=np.int64)
+    row_starts = rows * (n - 1) - rows * (rows - 1) // 2
+    k = _bernoulli_positions(n * (n - 1) // 2, p, rng)
+    sources = np.searchsorted(row_starts, k, side="right") - 1
+    return sources, sources + 1 + (k - row_starts[sources])
+
+
+def random_tree_parents(n, rng=None, start=0):
+    """
+    Parent array of a random recursive tree on nodes start..start+n-1: every
+    node after the first picks its parent uniformly among the nodes before it.
+
+    Returns:
+        children, parents: int64 arrays of length n - 1
+    """
+    rng = np.random.default_rng(rng)
+    if n < 2:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    offsets = np.arange(1, n, dtype=np.int64)
+    parents = (rng.random(n - 1) * offsets).astype(np.int64)
+    return offsets + start, parents + start
+
+
+def _undirected(n, sources, targets):
+    """CSRGraph holding both directions of every edge"""
+    return CSRGraph.from_edge_arrays(n, np.concatenate([sources, targets]),
+                                     np.concatenate([targets, sources]))
+
+
+def _add_extra_edges(n, sources, targets, u, v):
+    """
+    Append the undirected edges (u, v) that are not self-loops and not
+    already present, keeping the first copy of a pair drawn twice.
+    """
+    keep = u != v
+    u, v = u[keep], v[keep]
+    new_keys = np.minimum(u, v) * n + np.maximum(u, v)
+    _, first = np.unique(new_keys, return_index=True)
+    first.sort()
+    u, v, new_keys = u[first], v[first], new_keys[first]
+    fresh = ~np.isin(new_keys, np.minimum(sources, targets) * n + np.maximum(sources, targets))
+    return np.concatenate([sources, u[fresh]]), np.concatenate([targets, v[fresh]])
+
+
+def generate_complete_graph_csr(n, rng=None):
+    """Complete graph with n nodes"""
+    return CSRGraph.from_edge_arrays(n, *erdos_renyi_edges(n, 1.0, rng))
+
+
+def generate_dense_graph_csr(n, edge_ratio=0.8, rng=None):
+    """Directed G(n, edge_ratio) graph"""
+    return CSRGraph.from_edge_arrays(n, *erdos_renyi_edges(n, edge_ratio, rng))
+
+
+def generate_sparse_graph_csr(n, rng=None):
+    """Random spanning tree plus about n/2 extra edges (approximately 2n edges in all)"""
+    rng = np.random.default_rng(rng)
+    sources, targets = random_tree_parents(n, rng)
+    if n > 0:
+        extra = n // 2
+        sources, targets = _add_extra_edges(n, sources, targets,
+                                            rng.integers(0, n, extra), rng.integers(0, n, extra))
+    return _undirected(n, sources, targets)
+
+
+def generate_tree_graph_csr(n, rng=None):
+    """Binary tree with n nodes, node i's parent being (i - 1) // 2"""
+    children = np.arange(1, max(n, 1), dtype=np.int64)
+    return _undirected(n, (children - 1) // 2, children)
+
+
+def generate_connected_graph_csr(n, rng=None):
+    """Connected graph: random spanning tree plus about n/2 extra edges"""
+    return generate_sparse_graph_csr(n, rng)
+
+
+def generate_disconnected_graph_csr(n, rng=None):
+    """About sqrt(n) components, each a random tree over a block of consecutive nodes"""
+    rng = np.random.default_rng(rng)
+    num_components = max(2, int(n ** 0.5))
+    nodes_per_component = n // num_components
+
+    # Every node except the first of its block picks a parent earlier in it;
+    # the last block also takes the leftover nodes
+    nodes = np.arange(n, dtype=np.int64)
+    if nodes_per_component:
+        block = np.minimum(nodes // nodes_per_component, num_components - 1)
+        block_start = block * nodes_per_component
+    else:
+        block_start = np.zeros(n, dtype=np.int64)
+    child = nodes[nodes > block_start]
+    block_start = block_start[child]
+    parents = block_start + (rng.random(len(child)) * (child - block_start)).astype(np.int64)
+    return _undirected(n, parents, child)
+
+
+def generate_cyclic_graph_csr(n, rng=None):
+    """Undirected ring through all nodes plus about n/2 random chords"""
+    rng = np.random.default_rng(rng)
+    sources = np.arange(n, dtype=np.int64)
+    targets = (sources + 1) % max(n, 1)
+    if n >= 2:
+        extra = n // 2
+        u = rng.integers(0, n, extra)
+        # A distinct second endpoint, like random.sample(range(n), 2)
+        v = (u + rng.integers(1, n, extra)) % n
+        sources, targets = _add_extra_edges(n, sources, targets, u, v)
+    return _undirected(n, sources, targets)
+
+
+def generate_acyclic_graph_csr(n, rng=None):
+    """Directed acyclic graph: each edge i -> j with i < j present with probability 0.2"""
+    return CSRGraph.from_edge_arrays(n, *upper_triangle_edges(n, 0.2, rng))
+
+
+def generate_grid_graph_csr(n, rng=None):
+    """Grid graph with approximately n nodes, laid out row by row"""
+    if n == 0:
+        return CSRGraph.from_edge_arrays(0, [], [])
+    rows = int(math.sqrt(n))
+    cols = int(math.ceil(n / rows))
+    nodes = np.arange(n, dtype=np.int64)
+    right = nodes[(nodes % cols + 1 < cols) & (nodes + 1 < n)]
+    down = nodes[(nodes // cols + 1 < rows) & (nodes + cols < n)]
+    sources = np.concatenate([right, down])
+    targets = np.concatenate([right + 1, down + cols])
+    return _undirected(n, sources, targets)
+
+
+def add_random_weights(graph, min_weight=1, max_weight=10, rng=None, symmetric=False):
+    """
+    Weighted copy of graph with integer weights drawn uniformly from
+    [min_weight, max_weight]. Repeated edges are merged into one.
+
+    With symmetric=True the reverse of every edge is added as well and both
+    directions share a weight, which is what the MST algorithms expect.
+    """
+    rng = np.random.default_rng(rng)
+    n = len(graph)
+    offsets, targets, _ = graph.as_numpy()
+    sources = np.repeat(np.arange(n, dtype=np.int64), np.diff(offsets))
+    targets = targets.astype(np.int64)
+    if symmetric:
+        sources, targets = np.concatenate([sources, targets]), np.concatenate([targets, sources])
+
+    keys = np.unique(sources * n + targets)
+    sources, targets = keys // n, keys % n
+    if symmetric:
+        _, pair = np.unique(np.minimum(sources, targets) * n + np.maximum(sources, targets),
+                            return_inverse=True)
+        weights = rng.integers(min_weight, max_weight + 1, len(keys))[pair]
+    else:
+        weights = rng.integers(min_weight, max_weight + 1, len(keys))
+    return CSRGraph.from_edge_arrays(n, sources, targets, weights)
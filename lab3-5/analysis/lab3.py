@@ -1,26 +1,12 @@
 import os
 import time
-import sys
 import matplotlib.pyplot as plt
 from collections import deque
 
 # Import the helpers
 from helpers.bfs import bfs, measure_bfs_performance
 from helpers.dfs import dfs, measure_dfs_performance
-from helpers.graph_builders import (
-    generate_complete_graph,
-    generate_dense_graph,
-    generate_sparse_graph,
-    generate_tree_graph,
-    generate_connected_graph,
-    generate_disconnected_graph,
-    generate_cyclic_graph,
-    generate_acyclic_graph,
-    generate_grid_graph
-)
-
-# Increase recursion limit for large graphs
-sys.setrecursionlimit(16000)
+from helpers.graph_corpus import GRAPH_TYPES, get_graph
 
 # Create output directory
 os.makedirs("graphs/lab3", exist_ok=True)
@@ -35,19 +21,6 @@ os.makedirs("graphs/lab3", exist_ok=True)
 
 SIZES = [i for i in range(1, 4500, 250)]
 
-# Define graph types with their generator functions
-GRAPH_TYPES = {
-    "Complete Graph": generate_complete_graph,
-    "Dense Graph": generate_dense_graph,
-    "Sparse Graph": generate_sparse_graph,
-    "Tree Graph": generate_tree_graph,
-    "Connected Graph": generate_connected_graph,
-    "Disconnected Graph": generate_disconnected_graph,
-    "Cyclic Graph": generate_cyclic_graph,
-    "Acyclic Graph": generate_acyclic_graph,
-    "Grid Graph": generate_grid_graph
-}
-
 
 def run_tests():
     """Run BFS and DFS tests on all graph types and collect metrics"""
@@ -57,11 +30,12 @@ def run_tests():
     for size in SIZES:
         print(f"Testing graphs with {size} nodes...")
 
-        for graph_type, generator_func in GRAPH_TYPES.items():
+        for graph_type in GRAPH_TYPES:
             print(f"  {graph_type}...")
 
-            # Generate graph
-            graph = generator_func(size)
+            # Load the shared corpus graph (generated on first use) and time
+            # the traversals on plain lists, their fast representation
+            graph = get_graph(graph_type, size).to_adjacency_list()
 
             # Test BFS
             bfs_metrics = measure_bfs_performance(graph, start_node=0)
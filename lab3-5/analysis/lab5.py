@@ -1,27 +1,12 @@
 import os
 import time
-import sys
 import matplotlib.pyplot as plt
-import random
 import numpy as np
 
 # Import the helpers
 from helpers.kruskal import kruskal, measure_kruskal_performance, test_kruskal
 from helpers.prim import prim, measure_prim_performance, test_prim, find_largest_component
-from helpers.graph_builders import (
-    generate_complete_graph,
-    generate_dense_graph,
-    generate_sparse_graph,
-    generate_tree_graph,
-    generate_connected_graph,
-    generate_disconnected_graph,
-    generate_cyclic_graph,
-    generate_acyclic_graph,
-    generate_grid_graph
-)
-
-# Increase recursion limit for large graphs
-sys.setrecursionlimit(16000)
+from helpers.graph_corpus import GRAPH_TYPES, get_graph
 
 # Create output directory
 os.makedirs("graphs/lab5", exist_ok=True)
@@ -29,70 +14,24 @@ os.makedirs("graphs/lab5", exist_ok=True)
 # Graph sizes to test
 SIZES = [i for i in range(1, 2400, 150)]
 
-# Define graph types with their generator functions
-GRAPH_TYPES = {
-    "Complete Graph": generate_complete_graph,
-    "Dense Graph": generate_dense_graph,
-    "Sparse Graph": generate_sparse_graph,
-    "Tree Graph": generate_tree_graph,
-    "Connected Graph": generate_connected_graph,
-    "Disconnected Graph": generate_disconnected_graph,
-    "Cyclic Graph": generate_cyclic_graph,
-    "Acyclic Graph": generate_acyclic_graph,
-    "Grid Graph": generate_grid_graph
-}
-
-
-def add_weights(adj, min_weight=1, max_weight=10):
-    """Convert an unweighted adjacency list to a weighted one"""
-    weighted_adj = [{} for _ in range(len(adj))]
-    for u in range(len(adj)):
-        for v in adj[u]:
-            if v not in weighted_adj[u]:  # Avoid duplicating edges
-                weight = random.randint(min_weight, max_weight)
-                weighted_adj[u][v] = weight
-                weighted_adj[v][u] = weight  # Ensure graph is undirected for MST
-    return weighted_adj
-
-
-def make_undirected(adj):
-    """Make a directed graph undirected for MST algorithms"""
-    n = len(adj)
-    undirected = [[] for _ in range(n)]
-
-    for u in range(n):
-        for v in adj[u]:
-            undirected[u].append(v)
-            undirected[v].append(u)  # Add reverse edge
-
-    # Remove duplicates
-    for i in range(n):
-        undirected[i] = list(set(undirected[i]))
-
-    return undirected
-
 
 def run_tests():
     """Run MST tests on all graph types and collect metrics"""
     results_kruskal = {graph_type: [] for graph_type in GRAPH_TYPES}
     results_prim = {graph_type: [] for graph_type in GRAPH_TYPES}
+    # Prim with heapq and lazy deletion, on the same graphs
+    results_prim_heapq = {graph_type: [] for graph_type in GRAPH_TYPES}
 
     for size in SIZES:
         print(f"Testing graphs with {size} nodes...")
 
-        for graph_type, generator_func in GRAPH_TYPES.items():
+        for graph_type in GRAPH_TYPES:
             print(f"  {graph_type}...")
 
-            # Generate graph
-            graph = generator_func(size)
-
-            # Handle directed acyclic graphs by making them undirected
-            if graph_type == "Acyclic Graph":
-                print("    Making acyclic graph undirected for MST")
-                graph = make_undirected(graph)
-
-            # Convert to weighted
-            weighted_graph = add_weights(graph)
+            # Corpus graph with symmetric weights; this also makes the
+            # directed acyclic graph undirected for MST. Timed as
+            # {neighbor: weight} dictionaries, not CSR rows
+            weighted_graph = get_graph(graph_type, size, weighting="symmetric").to_weighted_adjacency()
 
             # Handle disconnected graphs
             if graph_type == "Disconnected Graph":
@@ -121,7 +60,15 @@ def run_tests():
                 print(f"    Error in Prim: {e}")
                 results_prim[graph_type].append(float('nan'))
 
-    return results_kruskal, results_prim
+            try:
+                prim_heapq_time = test_prim(weighted_graph, start_node, heap="heapq")
+                results_prim_heapq[graph_type].append(prim_heapq_time * 1000)  # Convert to ms
+                print(f"    Prim (heapq): {prim_heapq_time * 1000:.2f}ms")
+            except Exception as e:
+                print(f"    Error in Prim (heapq): {e}")
+                results_prim_heapq[graph_type].append(float('nan'))
+
+    return results_kruskal, results_prim, results_prim_heapq
 
 
 def plot_results(results_kruskal, results_prim):
@@ -201,13 +148,39 @@ def plot_results(results_kruskal, results_prim):
         plt.close()
 
 
+def plot_heap_comparison(results_prim, results_prim_heapq):
+    """Plot Prim with the indexed d-ary heap against heapq, one panel per graph type"""
+    plt.figure(figsize=(15, 12))
+
+    for i, graph_type in enumerate(GRAPH_TYPES, 1):
+        plt.subplot(3, 3, i)
+        for results, label, color in ((results_prim, 'Indexed 8-ary heap', 'seagreen'),
+                                      (results_prim_heapq, 'heapq (lazy deletion)', 'cornflowerblue')):
+            valid_times = [(s, t) for s, t in zip(SIZES, results[graph_type]) if not np.isnan(t)]
+            if valid_times:
+                sizes_valid, times_valid = zip(*valid_times)
+                plt.plot(sizes_valid, times_valid, marker='o', label=label, color=color)
+
+        plt.title(graph_type)
+        plt.xlabel('Number of Nodes')
+        plt.ylabel('Time (ms)')
+        plt.grid(True, alpha=0.3)
+        plt.legend(loc='upper left', fontsize='small')
+
+    plt.suptitle("Prim's Algorithm Priority Queues")
+    plt.tight_layout()
+    plt.savefig("graphs/lab5/heap_comparison.png")
+    plt.close()
+
+
 def main():
     """Main function to run tests and generate visualizations"""
     print("Starting MST algorithm tests...")
-    results_kruskal, results_prim = run_tests()
+    results_kruskal, results_prim, results_prim_heapq = run_tests()
 
     print("Generating performance plots...")
     plot_results(results_kruskal, results_prim)
+    plot_heap_comparison(results_prim, results_prim_heapq)
 
     print("All tests completed. Results saved to graphs/lab5/")
 